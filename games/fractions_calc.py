@@ -2,12 +2,12 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : Calculating fractions game
-# Version : 2.3.3
+# Version : 2.11.4
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
 # Created : 2023/04/10
-# Changed : 2026/02/16
+# Changed : 2026/10/19
 # URL     : http://github.com/gerardbm/maths
 # --------------------------------------------------
 """Calculating fractions game for the command line."""
@@ -16,8 +16,14 @@ import argparse
 import random
 import datetime
 import time
-from fractions import Fraction
 from pathlib import Path
+from fractions_catalog import Catalogue
+import leaderboard
+import players
+import rational
+import profiling
+import render
+import sessionpack
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -27,12 +33,12 @@ def parse_arguments():
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the numerator (1 ≤ A ≤ 4; default = 1)")
+        help="Digits for the numerator (A ≥ 1; default = 1)")
     parser.add_argument('-b',
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the denominator (1 ≤ B ≤ 4; default = 1)")
+        help="Digits for the denominator (B ≥ 1; default = 1)")
     parser.add_argument("-o",
         type=str,
         default='+-*/',
@@ -51,27 +57,64 @@ def parse_arguments():
     parser.add_argument('-c',
         action='store_true',
         help="Clear the previous saved scores and exit")
-    return parser.parse_args()
+    parser.add_argument('-t',
+        action='store_true',
+        help="Show the best and median time per round of every level "
+             "and exit")
+    players.add_arguments(parser)
+    render.add_arguments(parser)
+    profiling.add_arguments(parser)
+    parser.add_argument('-k',
+        type=str,
+        default=None,
+        metavar='File',
+        help="Draw the problems from a catalogue (see fractions_catalog.py)")
+    parser.add_argument('-d',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Maximum denominator of the simplified result (needs -k)")
+    parser.add_argument('-i',
+        action='store_true',
+        help="Only problems with an integer result (needs -k)")
+    parser.add_argument('-x',
+        action='store_true',
+        help="Only problems with a result that simplifies (needs -k)")
+    sessionpack.add_arguments(parser)
+    args = parser.parse_args()
+    players.check_arguments(parser, args)
+    if args.k and args.pack:
+        parser.error("Option -k can't be used with a session pack.")
+    if (args.d is not None or args.i or args.x) and args.k is None:
+        parser.error("Options -d, -i and -x need a catalogue (-k).")
+    if (args.d is not None or args.i or args.x) and args.s:
+        parser.error("Filtered games (-d, -i, -x) can't be saved (-s).")
+    return args
 
 def positive_digit(digit):
-    """Allow only digits between 1 and 4."""
+    """Allow only a positive number of digits."""
     int_digit = int(digit)
-    if int_digit < 1 or int_digit > 4:
-        raise argparse.ArgumentTypeError("Digits must be between 1 and 4.")
+    if int_digit < 1:
+        raise argparse.ArgumentTypeError("Digits must be 1 or more.")
     return int_digit
 
-def letsplay(digits_a, digits_b, opers, rounds, save):
+def letsplay(digits_a, digits_b, opers, rounds, save, problems=None,
+             player=players.human):
     """Start the game and show the score at the end."""
     score = 0
     count = 0
 
-    print()
-    print("Game starts. Play!")
+    if problems is None:
+        problems = random_problems(digits_a, digits_b, opers)
+
+    render.show(["", "Game starts. Play!"])
 
     start = time.time()
     while count < rounds:
         count += 1
-        score = operation(score, count, digits_a, digits_b, opers)
+        with profiling.phase('generation'):
+            problem = next(problems)
+        score = operation(score, count, digits_a, digits_b, problem, player)
     end = time.time()
 
     rights = score
@@ -82,18 +125,20 @@ def letsplay(digits_a, digits_b, opers, rounds, save):
     clean = '\033[0m'
     interval = end-start
 
-    if rights == rounds and save:
+    if rights == rounds and save and player is players.human:
         savetocsv(interval, rounds, f"{digits_a}/{digits_b}", opers)
 
-    print()
-    print(color + '>', str(percent) + "%", emoticon + clean)
-    print()
-    print("> Rights:", rights)
-    print("> Wrongs:", wrongs)
-    print()
-    print('> Time:', round(interval, 2), 'sec')
-    print('> Rate:', round((interval)/rounds, 2), 'sec/question')
-    print()
+    render.show([
+        "",
+        f"{color}> {percent}% {emoticon}{clean}",
+        "",
+        f"> Rights: {rights}",
+        f"> Wrongs: {wrongs}",
+        "",
+        f"> Time: {round(interval, 2)} sec",
+        f"> Rate: {round(interval/rounds, 2)} sec/question",
+        "",
+    ])
 
 def generate_operand(digits):
     """Generate a random number with a given number of digits."""
@@ -101,37 +146,41 @@ def generate_operand(digits):
     max_val = (10 ** digits) - 1
     return random.randint(min_val, max_val)
 
-def operation(score, count, digits_a, digits_b, opers):
+def random_problems(digits_a, digits_b, opers):
+    """Endless generator of random problems."""
+    while True:
+        num1 = generate_operand(digits_a)
+        den1 = generate_operand(digits_b)
+        num2 = generate_operand(digits_a)
+        den2 = generate_operand(digits_b)
+        ope = random.choice(tuple(opers))
+        yield num1, den1, num2, den2, ope
+
+def operation(score, count, digits_a, digits_b, problem, player):
     """Do a question and check the answer."""
-    num1 = generate_operand(digits_a)
-    den1 = generate_operand(digits_b)
-    num2 = generate_operand(digits_a)
-    den2 = generate_operand(digits_b)
-
-    frac1 = Fraction(num1, den1)
-    frac2 = Fraction(num2, den2)
-
-    ope = random.choice(tuple(opers))
-
-    if ope == '+':
-        result = frac1 + frac2
-        sym = '+'
-    elif ope == '-':
-        result = frac1 - frac2
-        sym = '-'
-    elif ope == '*':
-        result = frac1 * frac2
-        sym = '×'
-    elif ope == '/':
-        result = frac1 / frac2
-        sym = '÷'
-    else:
-        raise ValueError(f"Invalid operator: {ope}")
+    num1, den1, num2, den2, ope = problem
+
+    with profiling.phase('solving'):
+        frac1 = rational.Rational(num1, den1)
+        frac2 = rational.Rational(num2, den2)
+
+        if ope == '+':
+            result = frac1 + frac2
+            sym = '+'
+        elif ope == '-':
+            result = frac1 - frac2
+            sym = '-'
+        elif ope == '*':
+            result = frac1 * frac2
+            sym = '×'
+        elif ope == '/':
+            result = frac1 / frac2
+            sym = '÷'
+        else:
+            raise ValueError(f"Invalid operator: {ope}")
 
     ctr = str(count).zfill(2)
 
-    print()
-
     # Format the output
     maxim = max(digits_a, digits_b)
     cl = "-" * maxim + "--"
@@ -155,26 +204,35 @@ def operation(score, count, digits_a, digits_b, opers):
     # print(round(c2/3*2))
     # print(round(c2/1))
 
-    print(" " * c0 + cnum1 + str(num1) + " " * c3 + cnum2 + str(num2))
-    print(f"{ctr}. Solve this: {cl} {sym} {cl} = x")
-    print(" " * c0 + cden1 + str(den1) + " " * c3 + cden2 + str(den2))
-
-    while True:
-        print()
-        answer = input("What is the solution? ")
-        try:
-            num3, den3 = map(int, answer.split('/'))
-            user_fraction = Fraction(num3, den3)
-            break
-        except (ValueError, ZeroDivisionError):
-            print('\033[33m--- It must be a fraction: a/b.\033[0m')
-
-    if user_fraction == result:
-        print('\033[32m--- Good!\033[0m')
-        score += 1
-    else:
-        print('\033[31m--- Wrong!\033[0m')
-        print(f"Correct answer: {result}")
+    with profiling.phase('render'):
+        render.frame([
+            "",
+            " " * c0 + cnum1 + str(num1) + " " * c3 + cnum2 + str(num2),
+            f"{ctr}. Solve this: {cl} {sym} {cl} = x",
+            " " * c0 + cden1 + str(den1) + " " * c3 + cden2 + str(den2),
+            "",
+        ])
+
+    with profiling.phase('input'):
+        while True:
+            answer = player("What is the solution? ",
+                            f"{result.numerator}/{result.denominator}",
+                            f"{result.numerator + 1}/{result.denominator}")
+            try:
+                num3, den3 = map(int, answer.split('/'))
+                user_fraction = rational.Rational(num3, den3)
+                break
+            except (ValueError, ZeroDivisionError):
+                render.show(['\033[33m--- It must be a fraction: a/b.\033[0m',
+                             ""])
+
+    with profiling.phase('checking'):
+        if user_fraction == result:
+            render.show(['\033[32m--- Good!\033[0m'])
+            score += 1
+        else:
+            render.show(['\033[31m--- Wrong!\033[0m',
+                         f"Correct answer: {result}"])
 
     return score
 
@@ -232,6 +290,7 @@ def savetocsv(interval, rounds, level, opers):
     reg = f"{now}, {lvl}, {ops}, {rnd}, {sec}, {rpq}\n"
     with open(scores, 'a+', encoding='utf8') as file_handle:
         file_handle.write(reg)
+    leaderboard.update(scores)
 
 def show_scores():
     """Show saved scores from file."""
@@ -246,22 +305,61 @@ def show_scores():
 
 def main():
     """Main program."""
+    started = profiling.clock()
     args = parse_arguments()
 
     if args.l:
         show_scores()
         return
 
+    if args.t:
+        leaderboard.show(Path.home() / '.scores_fractions_calc.csv')
+        return
+
     if args.c:
         scores = Path.home() / '.scores_fractions_calc.csv'
         if scores.exists():
             scores.unlink()
+            leaderboard.clear(scores)
             print("Scores file deleted.")
         else:
             print("No scores file found to delete.")
         return
 
-    letsplay(args.a, args.b, args.o, args.r, args.s)
+    problems = None
+    if args.pack:
+        try:
+            pack, problems = sessionpack.problems(
+                args.pack, 'fractions_calc', args.r)
+        except ValueError as err:
+            print(err)
+            return
+        args.a, args.b, args.o = pack.digits_a, pack.digits_b, pack.opers
+
+    if args.k:
+        catalogue = Catalogue(args.k)
+        args.a, args.b = catalogue.digits_a, catalogue.digits_b
+        args.o = ''.join(op for op in catalogue.opers if op in args.o)
+        try:
+            problems = catalogue.sampler(opers=args.o, max_den=args.d,
+                                         integer=True if args.i else None,
+                                         reducible=True if args.x else None)
+            next(problems)
+        except ValueError as err:
+            print(err)
+            return
+
+    if args.screen:
+        render.enable_screen()
+
+    profiling.start(args.profile, args.profile_out, 'fractions_calc',
+                    started)
+    profiling.record('parse', started)
+    try:
+        letsplay(args.a, args.b, args.o, args.r, args.s, problems,
+                 players.from_arguments(args))
+    finally:
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
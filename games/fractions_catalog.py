@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Fractions problems catalogue
+# Version : 1.0.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Precomputed catalogue of problems for the calculating fractions game.
+
+The builder enumerates every problem (or a random subset of them, when the
+space is too large) for the given digits and operators and stores it in a
+binary file. Records are grouped in buckets by operator, result flags and
+size of the result numerator, and sorted by reduced denominator inside
+every bucket, so any filter maps to a few contiguous ranges of the file.
+
+File layout (little endian):
+    header  : magic, version, digits A, digits B, operators, records
+    buckets : (start, end) record offsets for every bucket
+    records : num1, den1, num2, den2, operator, flags,
+              result numerator digits, result denominator digits,
+              reduced denominator
+"""
+
+import argparse
+import bisect
+import itertools
+import mmap
+import random
+import struct
+from math import gcd
+
+MAGIC = b'FCAT'
+VERSION = 1
+HEADER = struct.Struct('<4sHBB8sQ')
+RECORD = struct.Struct('<4HBBBBI')
+OPERATORS = '+-*/'
+FLAG_INTEGER = 1
+FLAG_REDUCIBLE = 2
+FLAGS = 4
+SIZES = 10
+MAX_RECORDS = 1 << 24
+BUCKETS = struct.Struct(f'<{2 * len(OPERATORS) * FLAGS * SIZES}Q')
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build a catalogue of fractions problems.")
+    parser.add_argument('-a',
+        type=catalog_digit,
+        default=1,
+        metavar='Int',
+        help="Digits for the numerator (1 ≤ A ≤ 4; default = 1)")
+    parser.add_argument('-b',
+        type=catalog_digit,
+        default=1,
+        metavar='Int',
+        help="Digits for the denominator (1 ≤ B ≤ 4; default = 1)")
+    parser.add_argument("-o",
+        type=str,
+        default='+-*/',
+        help="Arithmetic operations: '+-*/' (default: all)")
+    parser.add_argument('-n',
+        type=int,
+        default=1000000,
+        metavar='Int',
+        help="Maximum number of problems; larger spaces are sampled "
+             "(default = 1000000)")
+    parser.add_argument('--seed',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Random seed used when the space is sampled")
+    parser.add_argument('file',
+        help="Output catalogue file")
+    args = parser.parse_args()
+    if not args.o or any(op not in OPERATORS for op in args.o):
+        parser.error("Operators must be some of '+-*/'.")
+    if args.n < 1:
+        parser.error("The number of problems must be positive.")
+    if args.n > MAX_RECORDS:
+        parser.error(f"A catalogue holds at most {MAX_RECORDS} problems.")
+    return args
+
+def catalog_digit(digit):
+    """Allow only digits between 1 and 4 (records use 16-bit operands)."""
+    int_digit = int(digit)
+    if int_digit < 1 or int_digit > 4:
+        raise argparse.ArgumentTypeError("Digits must be between 1 and 4.")
+    return int_digit
+
+def bucket_index(ope, flags, size):
+    """Position of a bucket in the bucket table."""
+    return (OPERATORS.index(ope) * FLAGS + flags) * SIZES + size
+
+def properties(num1, den1, num2, den2, ope):
+    """Result properties: flags, numerator digits, reduced denominator."""
+    if ope == '+':
+        num, den = num1 * den2 + num2 * den1, den1 * den2
+    elif ope == '-':
+        num, den = num1 * den2 - num2 * den1, den1 * den2
+    elif ope == '*':
+        num, den = num1 * num2, den1 * den2
+    elif ope == '/':
+        num, den = num1 * den2, den1 * num2
+    else:
+        raise ValueError(f"Invalid operator: {ope}")
+    common = gcd(num, den)
+    flags = 0
+    if common > 1:
+        flags |= FLAG_REDUCIBLE
+    num, den = num // common, den // common
+    if den == 1:
+        flags |= FLAG_INTEGER
+    return flags, len(str(abs(num))), len(str(den)), den
+
+def problem_space(digits_a, digits_b, opers, limit, seed=None):
+    """Every problem for the given sizes, or a random subset of them."""
+    nums = range(10 ** (digits_a - 1), 10 ** digits_a)
+    dens = range(10 ** (digits_b - 1), 10 ** digits_b)
+    opers = ''.join(op for op in OPERATORS if op in opers)
+    total = (len(nums) * len(dens)) ** 2 * len(opers)
+    if total <= limit:
+        yield from itertools.product(nums, dens, nums, dens, opers)
+        return
+    rng = random.Random(seed)
+    for _ in range(limit):
+        yield (rng.choice(nums), rng.choice(dens),
+               rng.choice(nums), rng.choice(dens), rng.choice(opers))
+
+def build(path, digits_a, digits_b, opers, limit, seed=None):
+    """Build the catalogue file and return the number of records."""
+    if limit > MAX_RECORDS:
+        raise ValueError(f"A catalogue holds at most {MAX_RECORDS} problems.")
+    records = bytearray()
+    keys = []
+    for i, problem in enumerate(
+            problem_space(digits_a, digits_b, opers, limit, seed)):
+        flags, nsize, dsize, rden = properties(*problem)
+        bucket = bucket_index(problem[4], flags, nsize)
+        keys.append(bucket << 56 | rden << 24 | i)
+        records += RECORD.pack(*problem[:4], OPERATORS.index(problem[4]),
+                               flags, nsize, dsize, rden)
+    keys.sort()  # record index in the low 24 bits (MAX_RECORDS)
+
+    bounds = [0] * (2 * len(OPERATORS) * FLAGS * SIZES)
+    for pos, key in enumerate(keys):
+        bucket = key >> 56
+        if bounds[2 * bucket + 1] == 0:
+            bounds[2 * bucket] = pos
+        bounds[2 * bucket + 1] = pos + 1
+
+    header = HEADER.pack(MAGIC, VERSION, digits_a, digits_b,
+                         opers.encode('ascii'), len(keys))
+    with open(path, 'wb') as file_handle:
+        file_handle.write(header)
+        file_handle.write(BUCKETS.pack(*bounds))
+        view = memoryview(records)
+        size = RECORD.size
+        for key in keys:
+            i = key & 0xFFFFFF
+            file_handle.write(view[i * size:(i + 1) * size])
+    return len(keys)
+
+class Catalogue:
+    """Read-only, memory-mapped view of a catalogue file."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as file_handle:
+            self.data = mmap.mmap(file_handle.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        (magic, version, self.digits_a, self.digits_b,
+         opers, self.count) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a fractions catalogue: {path}")
+        self.opers = opers.rstrip(b'\0').decode('ascii')
+        bounds = BUCKETS.unpack_from(self.data, HEADER.size)
+        self.buckets = list(zip(bounds[0::2], bounds[1::2]))
+        self.offset = HEADER.size + BUCKETS.size
+
+    def __len__(self):
+        return self.count
+
+    def record(self, index):
+        """Unpack the record at the given position."""
+        return RECORD.unpack_from(self.data,
+                                  self.offset + index * RECORD.size)
+
+    def problem(self, index):
+        """Problem at the given position: (num1, den1, num2, den2, op)."""
+        num1, den1, num2, den2, ope = self.record(index)[:5]
+        return num1, den1, num2, den2, OPERATORS[ope]
+
+    def _rden(self, index):
+        """Reduced denominator of the record at the given position."""
+        return self.record(index)[8]
+
+    def ranges(self, opers=OPERATORS, max_den=None, integer=None,
+               reducible=None, max_size=None):
+        """Contiguous record ranges matching a filter."""
+        found = []
+        for ope in opers:
+            if ope not in self.opers:
+                continue
+            for flags in range(FLAGS):
+                if integer is not None and \
+                        bool(flags & FLAG_INTEGER) != integer:
+                    continue
+                if reducible is not None and \
+                        bool(flags & FLAG_REDUCIBLE) != reducible:
+                    continue
+                for size in range(1, SIZES):
+                    if max_size is not None and size > max_size:
+                        break
+                    start, end = self.buckets[bucket_index(ope, flags, size)]
+                    if max_den is not None and start < end:
+                        end = bisect.bisect_right(
+                            range(start, end), max_den,
+                            key=self._rden) + start
+                    if start < end:
+                        found.append((start, end))
+        return found
+
+    def sampler(self, rng=random, **criteria):
+        """Endless generator of uniformly sampled problems."""
+        ranges = self.ranges(**criteria)
+        if not ranges:
+            raise ValueError("No problems match the filter.")
+        cumulative = list(itertools.accumulate(end - start
+                                               for start, end in ranges))
+        total = cumulative[-1]
+        while True:
+            pick = rng.randrange(total)
+            slot = bisect.bisect_right(cumulative, pick)
+            start, _ = ranges[slot]
+            before = cumulative[slot - 1] if slot else 0
+            yield self.problem(start + pick - before)
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    count = build(args.file, args.a, args.b, args.o, args.n, args.seed)
+    print(f"> {count} problems saved to {args.file}")
+
+if __name__ == '__main__':
+    main()
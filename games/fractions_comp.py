@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : Comparing fractions game
-# Version : 1.0.1
+# Version : 1.8.4
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
@@ -15,8 +15,14 @@ import argparse
 import random
 import datetime
 import time
-from fractions import Fraction
 from pathlib import Path
+import fractions_farey
+import leaderboard
+import players
+import rational
+import profiling
+import render
+import sessionpack
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -26,12 +32,12 @@ def parse_arguments():
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the numerator (1 ≤ A ≤ 4; default = 1)")
+        help="Digits for the numerator (A ≥ 1; default = 1)")
     parser.add_argument('-b',
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the denominator (1 ≤ B ≤ 4; default = 1)")
+        help="Digits for the denominator (B ≥ 1; default = 1)")
     parser.add_argument('-r',
         type=int,
         default=10,
@@ -46,27 +52,58 @@ def parse_arguments():
     parser.add_argument('-c',
         action='store_true',
         help="Clear the previous saved scores and exit")
-    return parser.parse_args()
+    parser.add_argument('-t',
+        action='store_true',
+        help="Show the best and median time per round of every level "
+             "and exit")
+    parser.add_argument('-d',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Hard questions: fractions at most Int places apart among "
+             "the values of the digits (0 = always equal)")
+    players.add_arguments(parser)
+    render.add_arguments(parser)
+    profiling.add_arguments(parser)
+    sessionpack.add_arguments(parser)
+    args = parser.parse_args()
+    players.check_arguments(parser, args)
+    if args.d is not None and args.pack:
+        parser.error("Option -d can't be used with a session pack.")
+    if args.d is not None:
+        if args.d < 0:
+            parser.error("Option -d must be 0 or more.")
+        if not fractions_farey.supported(args.a, args.b):
+            parser.error("Option -d needs at most "
+                         f"{len(str(fractions_farey.LIMIT)) - 1} "
+                         "digits in total.")
+    return args
 
 def positive_digit(digit):
-    """Allow only digits between 1 and 4."""
+    """Allow only a positive number of digits."""
     int_digit = int(digit)
-    if int_digit < 1 or int_digit > 4:
-        raise argparse.ArgumentTypeError("Digits must be between 1 and 4.")
+    if int_digit < 1:
+        raise argparse.ArgumentTypeError("Digits must be 1 or more.")
     return int_digit
 
-def letsplay(digits_a, digits_b, rounds, save):
+def letsplay(digits_a, digits_b, rounds, save, problems=None,
+             player=players.human):
     """Start the game and show the score at the end."""
     score = 0
     count = 0
 
-    print()
-    print("Game starts. Play!")
+    if problems is None:
+        problems = random_problems(digits_a, digits_b)
+
+    render.show(["", "Game starts. Play!"])
 
     start = time.time()
     while count < rounds:
         count += 1
-        score = comparison(score, count, digits_a, digits_b)
+        with profiling.phase('generation'):
+            problem = next(problems)
+        score = comparison(score, count, digits_a, digits_b, problem,
+                           player)
     end = time.time()
 
     rights = score
@@ -77,18 +114,20 @@ def letsplay(digits_a, digits_b, rounds, save):
     clean = '\033[0m'
     interval = end-start
 
-    if rights == rounds and save:
+    if rights == rounds and save and player is players.human:
         savetocsv(interval, rounds, f"{digits_a}/{digits_b}")
 
-    print()
-    print(color + '>', str(percent) + "%", emoticon + clean)
-    print()
-    print("> Rights:", rights)
-    print("> Wrongs:", wrongs)
-    print()
-    print('> Time:', round(interval, 2), 'sec')
-    print('> Rate:', round((interval)/rounds, 2), 'sec/question')
-    print()
+    render.show([
+        "",
+        f"{color}> {percent}% {emoticon}{clean}",
+        "",
+        f"> Rights: {rights}",
+        f"> Wrongs: {wrongs}",
+        "",
+        f"> Time: {round(interval, 2)} sec",
+        f"> Rate: {round(interval/rounds, 2)} sec/question",
+        "",
+    ])
 
 def generate_operand(digits):
     """Generate a random number with a given number of digits."""
@@ -96,27 +135,36 @@ def generate_operand(digits):
     max_val = (10 ** digits) - 1
     return random.randint(min_val, max_val)
 
-def comparison(score, count, digits_a, digits_b):
+def random_problems(digits_a, digits_b):
+    """Endless generator of random problems."""
+    while True:
+        num1 = generate_operand(digits_a)
+        den1 = generate_operand(digits_b)
+        num2 = generate_operand(digits_a)
+        den2 = generate_operand(digits_b)
+        yield num1, den1, num2, den2
+
+def hard_problems(digits_a, digits_b, distance):
+    """Endless generator of close (or equal) fractions."""
+    index = fractions_farey.FareyIndex(digits_a, digits_b)
+    return index.sampler(distance)
+
+def comparison(score, count, digits_a, digits_b, problem, player):
     """Do a question and check the answer."""
-    num1 = generate_operand(digits_a)
-    den1 = generate_operand(digits_b)
-    num2 = generate_operand(digits_a)
-    den2 = generate_operand(digits_b)
-
-    frac1 = Fraction(num1, den1)
-    frac2 = Fraction(num2, den2)
-
-    if frac1 < frac2:
-        result = "<"
-    elif frac1 > frac2:
-        result = ">"
-    else:
-        result = "="
+    num1, den1, num2, den2 = problem
+    with profiling.phase('solving'):
+        frac1 = rational.Rational(num1, den1)
+        frac2 = rational.Rational(num2, den2)
+
+        if frac1 < frac2:
+            result = "<"
+        elif frac1 > frac2:
+            result = ">"
+        else:
+            result = "="
 
     ctr = str(count).zfill(2)
 
-    print()
-
     # Format the output
     maxim = max(digits_a, digits_b)
     cl = "-" * maxim + "--"
@@ -140,24 +188,33 @@ def comparison(score, count, digits_a, digits_b):
     # print(round(c2/3*2))
     # print(round(c2/1))
 
-    print(" " * c0 + cnum1 + str(num1) + " " * c3 + cnum2 + str(num2))
-    print(f"{ctr}. Compare: {cl} \033[36m?\033[0m {cl}")
-    print(" " * c0 + cden1 + str(den1) + " " * c3 + cden2 + str(den2))
-
-    while True:
-        print()
-        answer = input("How do they compare? (<, >, =) ").strip()
-        if answer in ("<", ">", "="):
-            break
+    with profiling.phase('render'):
+        render.frame([
+            "",
+            " " * c0 + cnum1 + str(num1) + " " * c3 + cnum2 + str(num2),
+            f"{ctr}. Compare: {cl} \033[36m?\033[0m {cl}",
+            " " * c0 + cden1 + str(den1) + " " * c3 + cden2 + str(den2),
+            "",
+        ])
+
+    with profiling.phase('input'):
+        while True:
+            answer = player("How do they compare? (<, >, =) ", result,
+                            "<" if result != "<" else ">").strip()
+            if answer in ("<", ">", "="):
+                break
+            else:
+                render.show(
+                    ['\033[33m--- It must be one of these: <, >, =\033[0m',
+                     ""])
+
+    with profiling.phase('checking'):
+        if answer == result:
+            render.show(['\033[32m--- Good!\033[0m'])
+            score += 1
         else:
-            print('\033[33m--- It must be one of these: <, >, =\033[0m')
-
-    if answer == result:
-        print('\033[32m--- Good!\033[0m')
-        score += 1
-    else:
-        print('\033[31m--- Wrong!\033[0m')
-        print(f"Correct answer: {result}")
+            render.show(['\033[31m--- Wrong!\033[0m',
+                         f"Correct answer: {result}"])
 
     return score
 
@@ -196,6 +253,7 @@ def savetocsv(interval, rounds, level):
     reg = f"{now}, {lvl}, {rnd}, {sec}, {rpq}\n"
     with open(scores, 'a+', encoding='utf8') as file_handle:
         file_handle.write(reg)
+    leaderboard.update(scores)
 
 def show_scores():
     """Show saved scores from file."""
@@ -210,22 +268,56 @@ def show_scores():
 
 def main():
     """Main program."""
+    started = profiling.clock()
     args = parse_arguments()
 
     if args.l:
         show_scores()
         return
 
+    if args.t:
+        leaderboard.show(Path.home() / '.scores_fractions_comp.csv')
+        return
+
     if args.c:
         scores = Path.home() / '.scores_fractions_comp.csv'
         if scores.exists():
             scores.unlink()
+            leaderboard.clear(scores)
             print("Scores file deleted.")
         else:
             print("No scores file found to delete.")
         return
 
-    letsplay(args.a, args.b, args.r, args.s)
+    problems = None
+    if args.pack:
+        try:
+            pack, problems = sessionpack.problems(
+                args.pack, 'fractions_comp', args.r)
+        except ValueError as err:
+            print(err)
+            return
+        args.a, args.b = pack.digits_a, pack.digits_b
+
+    if args.d is not None:
+        problems = hard_problems(args.a, args.b, args.d)
+        try:
+            next(problems)
+        except ValueError as err:
+            print(err)
+            return
+
+    if args.screen:
+        render.enable_screen()
+
+    profiling.start(args.profile, args.profile_out, 'fractions_comp',
+                    started)
+    profiling.record('parse', started)
+    try:
+        letsplay(args.a, args.b, args.r, args.s, problems,
+                 players.from_arguments(args))
+    finally:
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Close fractions sampler
+# Version : 1.0.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Sampler of pairs of fractions that are hard to compare.
+
+The index holds every value p/q (in lowest terms) that can be written
+with the digits of the game, in increasing order. It is built with the
+next-term rule of the Farey sequence, extended to a bounded numerator:
+after a/b and c/d the next value is (k*c - a)/(k*d - b), with the largest
+k that keeps both terms within the bounds, so there is no sorting and no
+gcd. Two values at a given distance in the index are neighbours in the
+Stern-Brocot sense when the distance is 1; at distance 0 the pair is the
+same value written in two different ways (e.g. 2/6 and 3/9). Every pair
+is drawn in O(1): a random index, and a random multiple k*p / k*q of
+each value that fits the digits.
+"""
+
+import argparse
+import itertools
+import random
+import time
+from array import array
+from math import gcd
+
+LIMIT = 10 ** 6
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the close fractions sampler.")
+    parser.add_argument('-a',
+        type=int,
+        default=2,
+        metavar='Int',
+        help="Digits for the numerator (default = 2)")
+    parser.add_argument('-b',
+        type=int,
+        default=2,
+        metavar='Int',
+        help="Digits for the denominator (default = 2)")
+    parser.add_argument('-d',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Largest distance between the values (default = 1)")
+    parser.add_argument('-n',
+        type=int,
+        default=100000,
+        metavar='Int',
+        help="Pairs drawn by every sampler (default = 100000)")
+    return parser.parse_args()
+
+def supported(digits_a, digits_b):
+    """Check whether the index for these digits is small enough."""
+    return 10 ** (digits_a + digits_b) <= LIMIT
+
+class FareyIndex:
+    """Sorted values that fit the digits, and their multiples."""
+
+    def __init__(self, digits_a, digits_b):
+        if not supported(digits_a, digits_b):
+            raise ValueError("Close fractions need at most "
+                             f"{len(str(LIMIT)) - 1} digits in total.")
+        self.num_range = (10 ** (digits_a - 1), 10 ** digits_a - 1)
+        self.den_range = (10 ** (digits_b - 1), 10 ** digits_b - 1)
+        num_low, num_high = self.num_range
+        den_low, den_high = self.den_range
+        self.nums = array('I')
+        self.dens = array('I')
+        a, b, c, d = 0, 1, 1, den_high
+        while c * den_low <= num_high * d:
+            if c * den_high >= num_low * d and self._fits(c, d):
+                self.nums.append(c)
+                self.dens.append(d)
+            k = min((den_high + b) // d, (num_high + a) // c)
+            a, b, c, d = c, d, k * c - a, k * d - b
+        self.multiple = array('I', [
+            index for index, (low, high)
+            in enumerate(map(self.multipliers, range(len(self))))
+            if high > low])
+
+    def _fits(self, p, q):
+        """Check whether some multiple of p/q fits the digits."""
+        low, high = self._bounds(p, q)
+        return low <= high
+
+    def _bounds(self, p, q):
+        """Smallest and largest k such that k*p / k*q fits the digits."""
+        return (max(-(-self.num_range[0] // p), -(-self.den_range[0] // q)),
+                min(self.num_range[1] // p, self.den_range[1] // q))
+
+    def __len__(self):
+        return len(self.nums)
+
+    def multipliers(self, index):
+        """Smallest and largest multiplier of a value."""
+        return self._bounds(self.nums[index], self.dens[index])
+
+    def draw(self, index, rng=random):
+        """Random way of writing a value, as (num, den)."""
+        low, high = self.multipliers(index)
+        k = rng.randint(low, high)
+        return k * self.nums[index], k * self.dens[index]
+
+    def pair(self, distance, rng=random):
+        """Two fractions whose values are a distance apart in the index."""
+        if distance == 0:
+            if not self.multiple:
+                raise ValueError("No value can be written in two ways.")
+            index = rng.choice(self.multiple)
+            low, high = self.multipliers(index)
+            k1, k2 = rng.sample(range(low, high + 1), 2)
+            p, q = self.nums[index], self.dens[index]
+            return k1 * p, k1 * q, k2 * p, k2 * q
+        if distance >= len(self):
+            raise ValueError("There are not so many different values.")
+        index = rng.randrange(len(self) - distance)
+        first = self.draw(index, rng)
+        second = self.draw(index + distance, rng)
+        if rng.random() < 0.5:
+            first, second = second, first
+        return first + second
+
+    def sampler(self, max_distance, rng=random):
+        """Endless generator of pairs, distance uniform in 0..max."""
+        if max_distance >= len(self):
+            raise ValueError("There are not so many different values.")
+        while True:
+            yield self.pair(rng.randint(0, max_distance), rng)
+
+    def ranks(self):
+        """Position of every value in the index."""
+        return {(p, q): rank
+                for rank, (p, q) in enumerate(zip(self.nums, self.dens))}
+
+def rejection(index, max_distance, rng=random):
+    """Endless generator of close pairs by rejection sampling."""
+    ranks = index.ranks()
+    num_range, den_range = index.num_range, index.den_range
+    while True:
+        distance = rng.randint(0, max_distance)
+        while True:
+            num1, den1 = rng.randint(*num_range), rng.randint(*den_range)
+            num2, den2 = rng.randint(*num_range), rng.randint(*den_range)
+            common1, common2 = gcd(num1, den1), gcd(num2, den2)
+            rank1 = ranks[num1 // common1, den1 // common1]
+            rank2 = ranks[num2 // common2, den2 // common2]
+            if abs(rank1 - rank2) == distance and \
+                    (num1, den1) != (num2, den2):
+                break
+        yield num1, den1, num2, den2
+
+def benchmark(name, generator, count):
+    """Draw a number of pairs and show the throughput."""
+    start = time.perf_counter()
+    for _ in itertools.islice(generator, count):
+        pass
+    interval = time.perf_counter() - start
+    print(f"> {name}: {count / interval:,.2f} pairs/sec")
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    start = time.perf_counter()
+    index = FareyIndex(args.a, args.b)
+    interval = time.perf_counter() - start
+    print(f"> Index: {len(index):,} values "
+          f"({len(index.multiple):,} with several forms), "
+          f"{round(interval, 2)} sec")
+    print()
+    print(f"Values at most {args.d} apart:")
+    benchmark("Rejection", rejection(index, args.d),
+              max(1, args.n // 10000))
+    benchmark("Sampler  ", index.sampler(args.d), args.n)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Reducible fractions sampler
+# Version : 1.0.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Rejection-free sampler of fractions with a given common factor.
+
+A fraction num/den with gcd g is g*p / g*q with p and q coprime, so the
+sampler picks g first and then a coprime pair (p, q) that keeps the
+numerator and the denominator within their digits. For every g it keeps a
+cumulative table with how many valid q are coprime to every p (counted by
+inclusion-exclusion over the prime factors of p, taken from a smallest
+prime factor sieve), so a fraction is drawn with one bisection and one
+binary search, without retries.
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+import time
+from math import gcd
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the reducible fractions sampler.")
+    parser.add_argument('-a',
+        type=int,
+        default=4,
+        metavar='Int',
+        help="Digits for the numerator (default = 4)")
+    parser.add_argument('-b',
+        type=int,
+        default=4,
+        metavar='Int',
+        help="Digits for the denominator (default = 4)")
+    parser.add_argument('-g',
+        type=int,
+        default=12,
+        metavar='Int',
+        help="Largest common factor for the uniform benchmark "
+             "(default = 12)")
+    parser.add_argument('-n',
+        type=int,
+        default=100000,
+        metavar='Int',
+        help="Fractions drawn by every sampler (default = 100000)")
+    return parser.parse_args()
+
+def smallest_factors(limit):
+    """Smallest prime factor of every number up to the limit."""
+    spf = list(range(limit + 1))
+    for i in range(2, int(limit ** 0.5) + 1):
+        if spf[i] == i:
+            for j in range(i * i, limit + 1, i):
+                if spf[j] == j:
+                    spf[j] = i
+    return spf
+
+def squarefree_divisors(number, spf):
+    """Squarefree divisors of a number with their Möbius sign."""
+    divisors = [(1, 1)]
+    while number > 1:
+        prime = spf[number]
+        while number % prime == 0:
+            number //= prime
+        divisors += [(div * prime, -sign) for div, sign in divisors]
+    return divisors
+
+def count_coprime(upper, divisors):
+    """How many numbers in 1..upper are coprime to a number."""
+    return sum(sign * (upper // div) for div, sign in divisors)
+
+class ReducibleSampler:
+    """Sampler of fractions num/den with a chosen gcd."""
+
+    def __init__(self, digits_a, digits_b):
+        self.num_range = (10 ** (digits_a - 1), 10 ** digits_a - 1)
+        self.den_range = (10 ** (digits_b - 1), 10 ** digits_b - 1)
+        self.spf = smallest_factors(max(self.num_range[1],
+                                        self.den_range[1]))
+        self.tables = {}
+
+    def table(self, common):
+        """Cumulative coprime counts for every reduced numerator."""
+        if common not in self.tables:
+            p_low = -(-self.num_range[0] // common)
+            p_high = self.num_range[1] // common
+            q_low = -(-self.den_range[0] // common)
+            q_high = self.den_range[1] // common
+            counts = []
+            if q_low <= q_high:
+                for p in range(p_low, p_high + 1):
+                    divisors = squarefree_divisors(p, self.spf)
+                    counts.append(count_coprime(q_high, divisors)
+                                  - count_coprime(q_low - 1, divisors))
+            self.tables[common] = (p_low, q_low, q_high,
+                                   list(itertools.accumulate(counts)))
+        return self.tables[common]
+
+    def total(self, common):
+        """Number of fractions with exactly this gcd."""
+        cumulative = self.table(common)[3]
+        return cumulative[-1] if cumulative else 0
+
+    def feasible(self, low=2, high=None):
+        """Common factors in a range with at least one fraction."""
+        if high is None:
+            high = min(self.num_range[1], self.den_range[1])
+        return [g for g in range(low, high + 1) if self.total(g)]
+
+    def draw(self, common, rng=random):
+        """Uniform fraction (num, den) with gcd equal to common."""
+        p_low, q_low, q_high, cumulative = self.table(common)
+        pick = rng.randrange(cumulative[-1])
+        index = bisect.bisect_right(cumulative, pick)
+        p = p_low + index
+        rank = pick - (cumulative[index - 1] if index else 0)
+        divisors = squarefree_divisors(p, self.spf)
+        # Guess q from the density of coprimes, phi(p)/p, then walk to
+        # the exact one; the guess is off by a few numbers at most.
+        density = sum(sign / div for div, sign in divisors)
+        q = min(max(q_low + int(rank / density), q_low), q_high)
+        base = count_coprime(q_low - 1, divisors)
+        found = count_coprime(q, divisors) - base
+        while found <= rank:
+            q += 1
+            if gcd(q, p) == 1:
+                found += 1
+        while found > rank + 1 or gcd(q, p) != 1:
+            if gcd(q, p) == 1:
+                found -= 1
+            q -= 1
+        return common * p, common * q
+
+    def sampler(self, gcds, weights=None, rng=random):
+        """Endless generator of fractions; gcds drawn by weight."""
+        if not gcds:
+            raise ValueError("No fractions have these common factors.")
+        if weights is None:
+            while True:
+                yield self.draw(rng.choice(gcds), rng)
+        cumulative = list(itertools.accumulate(weights))
+        while True:
+            common = rng.choices(gcds, cum_weights=cumulative)[0]
+            yield self.draw(common, rng)
+
+def rejection(num_range, den_range, accept, rng=random):
+    """Endless generator of fractions by rejection sampling."""
+    while True:
+        num = rng.randint(*num_range)
+        den = rng.randint(*den_range)
+        if accept(gcd(num, den)):
+            yield num, den
+
+def uniform_rejection(num_range, den_range, gcds, rng=random):
+    """Rejection sampling with the gcd uniformly distributed."""
+    while True:
+        target = rng.choice(gcds)
+        yield next(rejection(num_range, den_range,
+                             lambda common: common == target, rng))
+
+def benchmark(name, generator, count):
+    """Draw a number of fractions and show the throughput."""
+    start = time.perf_counter()
+    for _ in itertools.islice(generator, count):
+        pass
+    interval = time.perf_counter() - start
+    print(f"> {name}: {round(count / interval):,} fractions/sec")
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    start = time.perf_counter()
+    sampler = ReducibleSampler(args.a, args.b)
+    reducible = sampler.feasible()
+    uniform = sampler.feasible(2, args.g)
+    weights = [sampler.total(g) for g in reducible]
+    interval = time.perf_counter() - start
+    print(f"> Tables: {len(reducible)} common factors, "
+          f"{round(interval, 2)} sec")
+
+    print()
+    print("Any common factor (gcd > 1):")
+    benchmark("Rejection", rejection(sampler.num_range, sampler.den_range,
+                                     lambda common: common > 1), args.n)
+    benchmark("Sampler  ", sampler.sampler(reducible, weights), args.n)
+
+    print()
+    print(f"Uniform common factor (2 ≤ gcd ≤ {args.g}):")
+    benchmark("Rejection", uniform_rejection(sampler.num_range,
+                                             sampler.den_range, uniform),
+              args.n)
+    benchmark("Sampler  ", sampler.sampler(uniform), args.n)
+
+if __name__ == '__main__':
+    main()
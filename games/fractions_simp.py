@@ -2,12 +2,12 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : Simplifying fractions game
-# Version : 1.0.2
+# Version : 1.7.3
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
 # Created : 2026/02/15
-# Changed : 2026/02/16
+# Changed : 2026/10/19
 # URL     : http://github.com/gerardbm/maths
 # --------------------------------------------------
 """Simplifying fractions game for the command line."""
@@ -17,8 +17,14 @@ import random
 import datetime
 import time
 import math
-from fractions import Fraction
 from pathlib import Path
+from fractions_sampler import ReducibleSampler
+import leaderboard
+import players
+import rational
+import profiling
+import render
+import sessionpack
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -28,12 +34,12 @@ def parse_arguments():
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the numerator (1 ≤ A ≤ 4; default = 1)")
+        help="Digits for the numerator (A ≥ 1; default = 1)")
     parser.add_argument('-b',
         type=positive_digit,
         default=1,
         metavar='Int',
-        help="Digits for the denominator (1 ≤ B ≤ 4; default = 1)")
+        help="Digits for the denominator (B ≥ 1; default = 1)")
     parser.add_argument('-r',
         type=int,
         default=10,
@@ -48,27 +54,59 @@ def parse_arguments():
     parser.add_argument('-c',
         action='store_true',
         help="Clear the previous saved scores and exit")
-    return parser.parse_args()
+    parser.add_argument('-t',
+        action='store_true',
+        help="Show the best and median time per round of every level "
+             "and exit")
+    parser.add_argument('-g',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Minimum common factor; with 2 or more every fraction "
+             "simplifies and its common factor is uniformly distributed "
+             "(default = 1)")
+    parser.add_argument('-m',
+        type=int,
+        default=12,
+        metavar='Int',
+        help="Maximum common factor when -g is 2 or more (default = 12)")
+    players.add_arguments(parser)
+    render.add_arguments(parser)
+    profiling.add_arguments(parser)
+    sessionpack.add_arguments(parser)
+    args = parser.parse_args()
+    players.check_arguments(parser, args)
+    if args.g > 1 and max(args.a, args.b) > 4:
+        parser.error("Option -g needs digits between 1 and 4.")
+    if args.g > 1 and args.pack:
+        parser.error("Option -g can't be used with a session pack.")
+    return args
 
 def positive_digit(digit):
-    """Allow only digits between 1 and 4."""
+    """Allow only a positive number of digits."""
     int_digit = int(digit)
-    if int_digit < 1 or int_digit > 4:
-        raise argparse.ArgumentTypeError("Digits must be between 1 and 4.")
+    if int_digit < 1:
+        raise argparse.ArgumentTypeError("Digits must be 1 or more.")
     return int_digit
 
-def letsplay(digits_a, digits_b, rounds, save):
+def letsplay(digits_a, digits_b, rounds, save, problems=None,
+             player=players.human):
     """Start the game and show the score at the end."""
     score = 0
     count = 0
 
-    print()
-    print("Game starts. Play!")
+    if problems is None:
+        problems = random_problems(digits_a, digits_b)
+
+    render.show(["", "Game starts. Play!"])
 
     start = time.time()
     while count < rounds:
         count += 1
-        score = simplification(score, count, digits_a, digits_b)
+        with profiling.phase('generation'):
+            problem = next(problems)
+        score = simplification(score, count, digits_a, digits_b, problem,
+                               player)
     end = time.time()
 
     rights = score
@@ -79,18 +117,20 @@ def letsplay(digits_a, digits_b, rounds, save):
     clean = '\033[0m'
     interval = end-start
 
-    if rights == rounds and save:
+    if rights == rounds and save and player is players.human:
         savetocsv(interval, rounds, f"{digits_a}/{digits_b}")
 
-    print()
-    print(color + '>', str(percent) + "%", emoticon + clean)
-    print()
-    print("> Rights:", rights)
-    print("> Wrongs:", wrongs)
-    print()
-    print('> Time:', round(interval, 2), 'sec')
-    print('> Rate:', round((interval)/rounds, 2), 'sec/question')
-    print()
+    render.show([
+        "",
+        f"{color}> {percent}% {emoticon}{clean}",
+        "",
+        f"> Rights: {rights}",
+        f"> Wrongs: {wrongs}",
+        "",
+        f"> Time: {round(interval, 2)} sec",
+        f"> Rate: {round(interval/rounds, 2)} sec/question",
+        "",
+    ])
 
 def generate_operand(digits):
     """Generate a random number with a given number of digits."""
@@ -98,17 +138,27 @@ def generate_operand(digits):
     max_val = (10 ** digits) - 1
     return random.randint(min_val, max_val)
 
-def simplification(score, count, digits_a, digits_b):
+def random_problems(digits_a, digits_b):
+    """Endless generator of random problems."""
+    while True:
+        num1 = generate_operand(digits_a)
+        den1 = generate_operand(digits_b)
+        yield num1, den1
+
+def reducible_problems(digits_a, digits_b, min_gcd, max_gcd):
+    """Endless generator of problems with a uniform common factor."""
+    sampler = ReducibleSampler(digits_a, digits_b)
+    return sampler.sampler(sampler.feasible(min_gcd, max_gcd))
+
+def simplification(score, count, digits_a, digits_b, problem, player):
     """Do a question and check the answer."""
-    num1 = generate_operand(digits_a)
-    den1 = generate_operand(digits_b)
+    num1, den1 = problem
 
-    result = Fraction(num1, den1)
+    with profiling.phase('solving'):
+        result = rational.Rational(num1, den1)
 
     ctr = str(count).zfill(2)
 
-    print()
-
     # Format the output
     maxim = max(digits_a, digits_b)
     cl = "-" * maxim + "--"
@@ -129,31 +179,40 @@ def simplification(score, count, digits_a, digits_b):
     # print(round(c2/3*2))
     # print(round(c2/1))
 
-    print(" " * c0 + cnum1 + str(num1))
-    print(f"{ctr}. Simplify: {cl} = x")
-    print(" " * c0 + cden1 + str(den1))
-
-    while True:
-        print()
-        answer = input("What is the result? ")
-        try:
-            num2, den2 = map(int, answer.split('/'))
-            if den2 == 0:
-                raise ZeroDivisionError
-            break
-        except (ValueError, ZeroDivisionError):
-            print('\033[33m--- It must be a fraction: a/b.\033[0m')
-
-    if Fraction(num2, den2) == result:
-        if math.gcd(num2, den2) == 1:
-            print('\033[32m--- Good!\033[0m')
-            score += 1
+    with profiling.phase('render'):
+        render.frame([
+            "",
+            " " * c0 + cnum1 + str(num1),
+            f"{ctr}. Simplify: {cl} = x",
+            " " * c0 + cden1 + str(den1),
+            "",
+        ])
+
+    with profiling.phase('input'):
+        while True:
+            answer = player("What is the result? ",
+                            f"{result.numerator}/{result.denominator}",
+                            f"{result.numerator + 1}/{result.denominator}")
+            try:
+                num2, den2 = map(int, answer.split('/'))
+                if den2 == 0:
+                    raise ZeroDivisionError
+                break
+            except (ValueError, ZeroDivisionError):
+                render.show(['\033[33m--- It must be a fraction: a/b.\033[0m',
+                             ""])
+
+    with profiling.phase('checking'):
+        if rational.Rational(num2, den2) == result:
+            if math.gcd(num2, den2) == 1:
+                render.show(['\033[32m--- Good!\033[0m'])
+                score += 1
+            else:
+                render.show(['\033[33m--- Wrong! (Not simplified)\033[0m',
+                             f"Correct simplified form: {result}"])
         else:
-            print('\033[33m--- Wrong! (Not simplified)\033[0m')
-            print(f"Correct simplified form: {result}")
-    else:
-        print('\033[31m--- Wrong! (Incorrect fraction)\033[0m')
-        print(f"Correct answer: {result}")
+            render.show(['\033[31m--- Wrong! (Incorrect fraction)\033[0m',
+                         f"Correct answer: {result}"])
 
     return score
 
@@ -192,6 +251,7 @@ def savetocsv(interval, rounds, level):
     reg = f"{now}, {lvl}, {rnd}, {sec}, {rpq}\n"
     with open(scores, 'a+', encoding='utf8') as file_handle:
         file_handle.write(reg)
+    leaderboard.update(scores)
 
 def show_scores():
     """Show saved scores from file."""
@@ -206,22 +266,56 @@ def show_scores():
 
 def main():
     """Main program."""
+    started = profiling.clock()
     args = parse_arguments()
 
     if args.l:
         show_scores()
         return
 
+    if args.t:
+        leaderboard.show(Path.home() / '.scores_fractions_simp.csv')
+        return
+
     if args.c:
         scores = Path.home() / '.scores_fractions_simp.csv'
         if scores.exists():
             scores.unlink()
+            leaderboard.clear(scores)
             print("Scores file deleted.")
         else:
             print("No scores file found to delete.")
         return
 
-    letsplay(args.a, args.b, args.r, args.s)
+    problems = None
+    if args.pack:
+        try:
+            pack, problems = sessionpack.problems(
+                args.pack, 'fractions_simp', args.r)
+        except ValueError as err:
+            print(err)
+            return
+        args.a, args.b = pack.digits_a, pack.digits_b
+
+    if args.g > 1:
+        problems = reducible_problems(args.a, args.b, args.g, args.m)
+        try:
+            next(problems)
+        except ValueError as err:
+            print(err)
+            return
+
+    if args.screen:
+        render.enable_screen()
+
+    profiling.start(args.profile, args.profile_out, 'fractions_simp',
+                    started)
+    profiling.record('parse', started)
+    try:
+        letsplay(args.a, args.b, args.r, args.s, problems,
+                 players.from_arguments(args))
+    finally:
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Leaderboard rollups
+# Version : 1.0.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Incremental rollups of the saved scores.
+
+The scores files only grow: savetocsv() appends one line per game. Next to
+every file (~/.scores_<game>.csv.idx) an index keeps the byte offset that
+has already been read and, for every level and mode, the count, the best
+and the median rate, and how many games had each rate (in hundredths of a
+second per round). Updating the index reads only the lines appended since
+the last time, and the size of the index depends on the number of
+different rates, not on the number of games; a leaderboard is then one
+lookup per level.
+
+If the scores file is shorter than the offset, or it does not start with
+the same bytes any more, it was cleared or rewritten, and the index is
+built again from the start.
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+
+VERSION = 1
+HEAD = 64
+
+def index_path(scores):
+    """Path of the index of a scores file."""
+    scores = Path(scores)
+    return scores.with_name(scores.name + '.idx')
+
+def empty():
+    """Index of an empty scores file."""
+    return {'version': VERSION, 'offset': 0, 'head': '', 'groups': {}}
+
+def load(scores):
+    """Read the index of a scores file, or an empty one."""
+    try:
+        with open(index_path(scores), 'r', encoding='utf8') as file_handle:
+            index = json.load(file_handle)
+    except (OSError, ValueError):
+        return empty()
+    if not isinstance(index, dict) or index.get('version') != VERSION:
+        return empty()
+    return index
+
+def save(scores, index):
+    """Write the index, replacing the old one at once."""
+    path = index_path(scores)
+    temporary = path.with_name(path.name + '.tmp')
+    with open(temporary, 'w', encoding='utf8') as file_handle:
+        json.dump(index, file_handle, separators=(',', ':'))
+    os.replace(temporary, path)
+
+def parse_row(line):
+    """Level, mode and rate (hundredths of sec/round) of a CSV line."""
+    fields = [field.strip() for field in line.split(',')]
+    if len(fields) < 5 or not fields[-1].endswith(' sec/round'):
+        return None
+    mode = fields[2] if fields[2].endswith(' mode') else ''
+    try:
+        rate = round(float(fields[-1].split()[0]) * 100)
+    except ValueError:
+        return None
+    return fields[1], mode, rate
+
+def add(index, level, mode, rate):
+    """Add one score to the rollups."""
+    group = index['groups'].setdefault(
+        f"{level}|{mode}", {'count': 0, 'best': rate, 'median': rate,
+                            'rates': {}})
+    group['count'] += 1
+    group['best'] = min(group['best'], rate)
+    group['rates'][str(rate)] = group['rates'].get(str(rate), 0) + 1
+
+def median(group):
+    """Median rate of a group, from the games of every rate."""
+    wanted = [(group['count'] - 1) // 2, group['count'] // 2]
+    found = []
+    seen = 0
+    for rate in sorted(group['rates'], key=int):
+        seen += group['rates'][rate]
+        while wanted and wanted[0] < seen:
+            found.append(int(rate))
+            wanted.pop(0)
+        if not wanted:
+            break
+    return (found[0] + found[1]) / 2
+
+def update(scores):
+    """Bring the index up to date with the scores file and return it."""
+    scores = Path(scores)
+    index = load(scores)
+    try:
+        file_handle = open(scores, 'rb')
+    except FileNotFoundError:
+        clear(scores)
+        return empty()
+    with file_handle:
+        size = os.fstat(file_handle.fileno()).st_size
+        head = file_handle.read(HEAD).hex()
+        if size < index['offset'] or not head.startswith(index['head']):
+            index = empty()
+        if index['offset'] == size:
+            return index
+        file_handle.seek(index['offset'])
+        appended = file_handle.read(size - index['offset'])
+    complete = appended.rfind(b'\n') + 1
+    touched = set()
+    for line in appended[:complete].decode('utf8').splitlines():
+        row = parse_row(line)
+        if row is not None:
+            add(index, *row)
+            touched.add(f"{row[0]}|{row[1]}")
+    for key in touched:
+        group = index['groups'][key]
+        group['median'] = median(group)
+    index['offset'] += complete
+    index['head'] = head[:2 * index['offset']]
+    save(scores, index)
+    return index
+
+def rollups(index):
+    """Level, mode, count, best and median rate of every group."""
+    rows = []
+    for key, group in index['groups'].items():
+        level, mode = key.split('|')
+        rows.append((level, mode, group['count'], group['best'] / 100,
+                     group['median'] / 100))
+    return sorted(rows)
+
+def clear(scores):
+    """Delete the index of a scores file."""
+    with contextlib.suppress(FileNotFoundError):
+        index_path(scores).unlink()
+
+def show(scores):
+    """Show the best and median rate for every level and mode."""
+    rows = rollups(update(scores))
+    if not rows:
+        print("No scores recorded yet.")
+        return
+    print("\nLeaderboard (sec/round):")
+    print("-----------------------")
+    for level, mode, count, best, median in rows:
+        name = f"{level}, {mode}" if mode else level
+        print(f"{name}: best {best:.2f}, median {median:.2f}, "
+              f"{count} games")
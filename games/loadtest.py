@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Load test for the games
+# Version : 1.0.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Play thousands of rounds of a game headlessly with a bot.
+
+The output of the game goes to a line-buffered sink, like a terminal, that
+counts the write calls it receives; the scores are never saved and the
+bot answers every question, so the timings measure the overhead of the
+game loop itself. A second run under tracemalloc reports the peak of the
+memory traced in every round, from one answer to the next, and the peak of
+the whole run.
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+import fractions_calc
+import fractions_comp
+import fractions_simp
+import multiplications
+import players
+
+GAMES = {
+    'multiplications': lambda args, player: multiplications.letsplay(
+        args.a, args.b, args.r, False, player=player),
+    'fractions_calc': lambda args, player: fractions_calc.letsplay(
+        args.a, args.b, args.o, args.r, False, player=player),
+    'fractions_simp': lambda args, player: fractions_simp.letsplay(
+        args.a, args.b, args.r, False, player=player),
+    'fractions_comp': lambda args, player: fractions_comp.letsplay(
+        args.a, args.b, args.r, False, player=player),
+}
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Load test for the games.")
+    parser.add_argument('game',
+        choices=sorted(GAMES),
+        help="Game to play")
+    parser.add_argument('-a',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Digits for the 1st operand or numerator (default = 1)")
+    parser.add_argument('-b',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Digits for the 2nd operand or denominator (default = 1)")
+    parser.add_argument("-o",
+        type=str,
+        default='+-*/',
+        help="Arithmetic operations for fractions_calc (default: all)")
+    parser.add_argument('-r',
+        type=int,
+        default=10000,
+        metavar='Int',
+        help="Number of rounds to play (default = 10000)")
+    parser.add_argument('--bot',
+        type=players.bot_type,
+        default=players.bot(1.0),
+        metavar='Mode',
+        help="Bot: 'right', 'random' or an accuracy (default: right)")
+    args = parser.parse_args()
+    if args.r < 1:
+        parser.error("The number of rounds must be positive.")
+    return args
+
+class CountingSink(io.RawIOBase):
+    """Raw stream that discards the data and counts the writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        return len(data)
+
+def headless(game, args, player):
+    """Play a game with the output discarded; return seconds, writes."""
+    sink = CountingSink()
+    stream = io.TextIOWrapper(io.BufferedWriter(sink), encoding='utf8',
+                              line_buffering=True)
+    with contextlib.redirect_stdout(stream):
+        start = time.perf_counter()
+        GAMES[game](args, player)
+        stream.flush()
+        interval = time.perf_counter() - start
+    return interval, sink.writes
+
+def allocations(game, args):
+    """Play a game under tracemalloc; return round peaks and the peak."""
+    peaks = []
+    base = None
+
+    def player(prompt, right, wrong):
+        nonlocal base
+        current, peak = tracemalloc.get_traced_memory()
+        if base is not None:
+            peaks.append(peak - base)
+        tracemalloc.reset_peak()
+        base = current
+        return args.bot(prompt, right, wrong)
+
+    tracemalloc.start()
+    try:
+        headless(game, args, player)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peaks, peak
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    interval, writes = headless(args.game, args, args.bot)
+    peaks, peak = allocations(args.game, args)
+
+    print()
+    print(f"> Game: {args.game} ({args.a}/{args.b} digits)")
+    print(f"> Rounds: {args.r}")
+    print(f"> Time: {round(interval, 3)} sec")
+    print(f"> Rate: {round(args.r / interval):,} rounds/sec")
+    print(f"> Writes: {round(writes / args.r, 2)} per round")
+    if peaks:
+        print(f"> Round peak: {round(sum(peaks) / len(peaks) / 1024, 1)} "
+              f"KiB mean, {round(max(peaks) / 1024, 1)} KiB max")
+    print(f"> Peak: {round(peak / 1024, 1)} KiB")
+
+if __name__ == '__main__':
+    main()
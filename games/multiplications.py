@@ -2,12 +2,12 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : Multiplications game
-# Version : 2.1.3
+# Version : 2.7.4
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
 # Created : 2019/02/08
-# Changed : 2026/02/16
+# Changed : 2026/10/19
 # URL     : http://github.com/gerardbm/maths
 # --------------------------------------------------
 """Multiplications game for the command line."""
@@ -17,6 +17,12 @@ import random
 import datetime
 import time
 from pathlib import Path
+import leaderboard
+import multiplications_walk
+import players
+import profiling
+import render
+import sessionpack
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -45,8 +51,35 @@ def parse_arguments():
         help="Show a list with the previous scores and exit")
     parser.add_argument('-c',
         action='store_true',
-        help="Clear the previous saved scores and exit")
-    return parser.parse_args()
+        help="Clear the previous saved scores and walks (-u) and exit")
+    parser.add_argument('-t',
+        action='store_true',
+        help="Show the best and median time per round of every level "
+             "and exit")
+    parser.add_argument('-u',
+        action='store_true',
+        help="Unique pairs: don't repeat a pair until all have been "
+             "asked, across sessions")
+    parser.add_argument('-w',
+        type=multiplications_walk.worker_type,
+        default=(0, 1),
+        metavar='I/W',
+        help="With -u, walk only the share of worker I of W (default = 0/1)")
+    parser.add_argument('--seed',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="With -u, seed of a new walk; give the same one to every "
+             "worker (default: a random one, saved)")
+    players.add_arguments(parser)
+    render.add_arguments(parser)
+    profiling.add_arguments(parser)
+    sessionpack.add_arguments(parser)
+    args = parser.parse_args()
+    players.check_arguments(parser, args)
+    if args.u and args.pack:
+        parser.error("Option -u can't be used with a session pack.")
+    return args
 
 def positive_digit(digit):
     """Allow only digits between 1 and 4."""
@@ -55,18 +88,24 @@ def positive_digit(digit):
         raise argparse.ArgumentTypeError("Digits must be between 1 and 4.")
     return int_digit
 
-def letsplay(digits_a, digits_b, rounds, save):
+def letsplay(digits_a, digits_b, rounds, save, problems=None,
+             player=players.human):
     """Start the game and show the score at the end."""
     score = 0
     count = 0
 
-    print()
-    print("Game starts. Play!")
+    if problems is None:
+        problems = random_problems(digits_a, digits_b)
+
+    render.show(["", "Game starts. Play!"])
 
     start = time.time()
     while count < rounds:
         count += 1
-        score = operation(score, count, digits_a, digits_b)
+        with profiling.phase('generation'):
+            problem = next(problems)
+        score = operation(score, count, digits_a, digits_b, problem,
+                          player)
     end = time.time()
 
     rights = score
@@ -77,17 +116,19 @@ def letsplay(digits_a, digits_b, rounds, save):
     clean = '\033[0m'
     interval = end-start
 
-    if rights == rounds and save:
+    if rights == rounds and save and player is players.human:
         savetocsv(interval, rounds, f"{digits_a}×{digits_b}")
 
-    print()
-    print(color + '>', str(percent) + "%", emoticon + clean)
-    print()
-    print("> Rights:", rights)
-    print("> Wrongs:", wrongs)
-    print()
-    print('> Time:', round(interval, 2), 'sec')
-    print('> Rate:', round((interval)/rounds, 2), 'sec/question')
+    render.show([
+        "",
+        f"{color}> {percent}% {emoticon}{clean}",
+        "",
+        f"> Rights: {rights}",
+        f"> Wrongs: {wrongs}",
+        "",
+        f"> Time: {round(interval, 2)} sec",
+        f"> Rate: {round(interval/rounds, 2)} sec/question",
+    ])
 
 def generate_operand(digits):
     """Generate a random number with a given number of digits."""
@@ -95,30 +136,41 @@ def generate_operand(digits):
     max_val = (10 ** digits) - 1
     return random.randint(min_val, max_val)
 
-def operation(score, count, digits_a, digits_b):
-    """Do a question and check the answer."""
-    numb1 = generate_operand(digits_a)
-    numb2 = generate_operand(digits_b)
+def random_problems(digits_a, digits_b):
+    """Endless generator of random problems."""
+    while True:
+        numb1 = generate_operand(digits_a)
+        numb2 = generate_operand(digits_b)
+        yield numb1, numb2
 
+def operation(score, count, digits_a, digits_b, problem, player):
+    """Do a question and check the answer."""
+    numb1, numb2 = problem
     result = numb1 * numb2
+
     problem = str(numb1) + "x" + str(numb2)
     enum = str(count).zfill(2)
     question = enum + ". The result of " + problem + " = "
 
-    while True:
-        print()
-        answer = input(question)
-        try:
-            answer = int(answer)
-            break
-        except ValueError:
-            print('\033[33m--- It must be an integer number.\033[0m')
-
-    if answer == result:
-        print('\033[32m' + "--- Good!" + '\033[0m')
-        score += 1
-    else:
-        print('\033[31m' + "--- Wrong!" + '\033[0m')
+    with profiling.phase('render'):
+        render.frame([""])
+
+    with profiling.phase('input'):
+        while True:
+            answer = player(question, str(result), str(result + 1))
+            try:
+                answer = int(answer)
+                break
+            except ValueError:
+                render.show(
+                    ['\033[33m--- It must be an integer number.\033[0m', ""])
+
+    with profiling.phase('checking'):
+        if answer == result:
+            render.show(['\033[32m' + "--- Good!" + '\033[0m'])
+            score += 1
+        else:
+            render.show(['\033[31m' + "--- Wrong!" + '\033[0m'])
     return score
 
 def emoticons(percent):
@@ -156,6 +208,7 @@ def savetocsv(interval, rounds, level):
     reg = f"{now}, {lvl}, {rnd}, {sec}, {rpq}\n"
     with open(scores, 'a+', encoding='utf8') as file_handle:
         file_handle.write(reg)
+    leaderboard.update(scores)
 
 def show_scores():
     """Show saved scores from file."""
@@ -170,22 +223,66 @@ def show_scores():
 
 def main():
     """Main program."""
+    started = profiling.clock()
     args = parse_arguments()
 
     if args.l:
         show_scores()
         return
 
+    if args.t:
+        leaderboard.show(Path.home() / '.scores_multiplications.csv')
+        return
+
     if args.c:
         scores = Path.home() / '.scores_multiplications.csv'
         if scores.exists():
             scores.unlink()
+            leaderboard.clear(scores)
             print("Scores file deleted.")
         else:
             print("No scores file found to delete.")
+        if multiplications_walk.STATE.exists():
+            multiplications_walk.clear()
+            print("Walks file deleted.")
         return
 
-    letsplay(args.a, args.b, args.r, args.s)
+    problems = None
+    if args.pack:
+        try:
+            pack, problems = sessionpack.problems(
+                args.pack, 'multiplications', args.r)
+        except ValueError as err:
+            print(err)
+            return
+        args.a, args.b = pack.digits_a, pack.digits_b
+
+    walk = None
+    if args.u:
+        try:
+            walk = multiplications_walk.load(args.a, args.b, *args.w,
+                                             args.seed)
+        except ValueError as err:
+            print(err)
+            return
+        problems = iter(walk)
+
+    if args.screen:
+        render.enable_screen()
+
+    profiling.start(args.profile, args.profile_out, 'multiplications',
+                    started)
+    profiling.record('parse', started)
+    try:
+        letsplay(args.a, args.b, args.r, args.s, problems,
+                 players.from_arguments(args))
+    finally:
+        if walk is not None:
+            try:
+                multiplications_walk.save(walk, args.a, args.b)
+            except ValueError as err:
+                print(err)
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
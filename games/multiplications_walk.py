@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Multiplications walk
+# Version : 1.1.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Walk every pair of factors once, in a random order.
+
+The pairs for the chosen digits are numbered 0..N-1 and visited in the
+order of a keyed permutation: a small Feistel network on the smallest even
+number of bits that holds N, with cycle walking (apply it again while the
+result is N or more). Only the seed, the cycle and the position are kept,
+so memory and time per question are O(1), and no pair repeats until all N
+have been asked; then the next cycle starts a new order. The key of every
+cycle comes from the seed and the number of the cycle, so anyone with the
+same seed walks the same orders.
+
+The walk is saved in ~/.multiplications_walk for every digit size, so it
+goes on in the next session; the file is locked while it is read and
+written. With several workers (I/W) and a shared seed, worker I takes the
+positions I, I + W, I + 2W... of every cycle, so parallel sessions never
+share a pair, on one computer or many.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+ROUNDS = 4
+STATE = Path.home() / '.multiplications_walk'
+
+class Walk:
+    """Pseudo-random permutation of the pairs of factors."""
+
+    def __init__(self, digits_a, digits_b, seed, cycle=0, position=None,
+                 worker=0, workers=1):
+        self.low_a = 10 ** (digits_a - 1)
+        self.low_b = 10 ** (digits_b - 1)
+        self.count_a = 9 * self.low_a
+        self.count_b = 9 * self.low_b
+        self.size = self.count_a * self.count_b
+        self.half = (max(2, (self.size - 1).bit_length()) + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.worker, self.workers = worker, workers
+        self.seed = seed
+        self.position = worker if position is None else position
+        self.start(cycle)
+
+    def start(self, cycle):
+        """Use the permutation of a cycle (the same for every worker)."""
+        self.cycle = cycle
+        rng = random.Random(f"{self.seed}/{cycle}")
+        self.keys = [rng.getrandbits(64) for _ in range(ROUNDS)]
+
+    def permute(self, value):
+        """Position of a pair in the walk order (a bijection on 0..N-1)."""
+        half, mask = self.half, self.mask
+        while True:
+            left, right = value >> half, value & mask
+            for key in self.keys:
+                mixed = (right + key) * 0x9E3779B97F4A7C15
+                left, right = right, left ^ ((mixed ^ mixed >> 29) & mask)
+            value = left << half | right
+            if value < self.size:
+                return value
+
+    def pair(self, position):
+        """Pair of factors at a position of the walk."""
+        value = self.permute(position)
+        return (self.low_a + value // self.count_b,
+                self.low_b + value % self.count_b)
+
+    def __iter__(self):
+        """Endless generator of pairs; a new cycle after every full walk."""
+        while True:
+            if self.position >= self.size:
+                self.start(self.cycle + 1)
+                self.position = self.worker
+            pair = self.pair(self.position)
+            self.position += self.workers
+            yield pair
+
+def worker_type(value):
+    """Worker I/W, with 0 ≤ I < W."""
+    try:
+        worker, workers = map(int, value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "Worker must be I/W, e.g. 0/4.") from None
+    if not 0 <= worker < workers:
+        raise argparse.ArgumentTypeError(
+            "Worker must be I/W with 0 ≤ I < W.")
+    return worker, workers
+
+@contextlib.contextmanager
+def locked(path):
+    """Hold an exclusive lock on the state file (where fcntl exists)."""
+    with open(Path(path).with_name(Path(path).name + '.lock'), 'a',
+              encoding='utf8') as lock_handle:
+        if fcntl is not None:
+            fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        yield
+
+def read(path):
+    """Saved walks of every digit size."""
+    try:
+        with open(path, 'r', encoding='utf8') as file_handle:
+            state = json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict):
+        return {}
+    return {name: saved for name, saved in state.items()
+            if isinstance(saved, dict) and 'seed' in saved}
+
+def write(path, state):
+    """Replace the saved walks at once."""
+    temporary = Path(path).with_name(Path(path).name + '.tmp')
+    with open(temporary, 'w', encoding='utf8') as file_handle:
+        json.dump(state, file_handle)
+    os.replace(temporary, path)
+
+def load(digits_a, digits_b, worker=0, workers=1, seed=None, path=STATE):
+    """Resume the saved walk for these digits, or start a new one."""
+    name = f"{digits_a}×{digits_b}"
+    with locked(path):
+        state = read(path)
+        if name not in state:
+            if seed is None:
+                seed = random.getrandbits(63)
+            state[name] = {'seed': seed, 'positions': {}}
+            write(path, state)
+        saved = state[name]
+    if seed is not None and seed != saved['seed']:
+        raise ValueError(f"The saved walk for {name} digits has another "
+                         "seed; clear it with -c to start a new one.")
+    cycle, position = saved['positions'].get(f"{worker}/{workers}",
+                                             (0, worker))
+    return Walk(digits_a, digits_b, saved['seed'], cycle, position, worker,
+                workers)
+
+def save(walk, digits_a, digits_b, path=STATE):
+    """Save the cycle and the position of a worker."""
+    name = f"{digits_a}×{digits_b}"
+    with locked(path):
+        state = read(path)
+        saved = state.setdefault(name, {'seed': walk.seed, 'positions': {}})
+        if saved['seed'] != walk.seed:
+            raise ValueError(f"The saved walk for {name} digits has another "
+                             "seed; this session was not saved.")
+        saved['positions'][f"{walk.worker}/{walk.workers}"] = [
+            walk.cycle, walk.position]
+        write(path, state)
+
+def clear(path=STATE):
+    """Forget every saved walk, and remove the lock file too."""
+    lock = Path(path).with_name(Path(path).name + '.lock')
+    with locked(path):
+        with contextlib.suppress(FileNotFoundError):
+            Path(path).unlink()
+        lock.unlink()
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Check and benchmark the multiplications walk.")
+    parser.add_argument('-a',
+        type=int,
+        default=2,
+        metavar='Int',
+        help="Digits for the 1st operand (default = 2)")
+    parser.add_argument('-b',
+        type=int,
+        default=2,
+        metavar='Int',
+        help="Digits for the 2nd operand (default = 2)")
+    parser.add_argument('-n',
+        type=int,
+        default=100000,
+        metavar='Int',
+        help="Pairs drawn for the timing (default = 100000)")
+    return parser.parse_args()
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    walk = Walk(args.a, args.b, seed=1)
+    if walk.size <= 10 ** 6:
+        seen = {walk.pair(position) for position in range(walk.size)}
+        print(f"> Permutation: {len(seen):,} different pairs "
+              f"out of {walk.size:,}")
+
+    pairs = iter(Walk(args.a, args.b, seed=2))
+    start = time.perf_counter()
+    for _ in range(args.n):
+        next(pairs)
+    interval = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in range(1000):
+        next(pairs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"> Walk: {round(args.n / interval):,} pairs/sec, "
+          f"peak {peak} bytes while drawing")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Players for the games
+# Version : 1.1.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Players that answer the questions of the games.
+
+A player is called as player(prompt, right, wrong) and returns the answer
+as a string: the human player reads it from the keyboard, the bot picks
+the right or the wrong answer given by the game, and the script player
+reads the answers, one per line, from a file.
+"""
+
+import argparse
+import random
+
+def human(prompt, right, wrong):
+    """Ask the question and wait for the answer."""
+    return input(prompt)
+
+def bot(accuracy, rng=random):
+    """Player that answers right with the given probability."""
+    def player(prompt, right, wrong):
+        return right if rng.random() < accuracy else wrong
+    return player
+
+def script(path):
+    """Player that answers with the lines of a file, in order."""
+    with open(path, 'r', encoding='utf8') as file_handle:
+        lines = iter(file_handle.read().splitlines())
+    def player(prompt, right, wrong):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError("No more answers in the script.") from None
+    return player
+
+def bot_type(mode):
+    """Bot mode: 'right', 'random' or an accuracy between 0 and 1."""
+    if mode == 'right':
+        return bot(1.0)
+    if mode == 'random':
+        return bot(0.5)
+    try:
+        accuracy = float(mode)
+    except ValueError:
+        accuracy = -1
+    if accuracy < 0 or accuracy > 1:
+        raise argparse.ArgumentTypeError(
+            "Bot must be 'right', 'random' or an accuracy from 0 to 1.")
+    return bot(accuracy)
+
+def add_arguments(parser):
+    """Add the player options to a game parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--bot',
+        type=bot_type,
+        default=None,
+        metavar='Mode',
+        help="Let a bot play: 'right', 'random' or an accuracy (0-1)")
+    group.add_argument('--script',
+        type=str,
+        default=None,
+        metavar='File',
+        help="Read the answers from a file, one per line")
+
+def check_arguments(parser, args):
+    """Refuse to save the scores of a bot or a script."""
+    if args.s and (args.bot is not None or args.script is not None):
+        parser.error("Option -s saves only the scores of a human player.")
+
+def from_arguments(args):
+    """Player chosen with the command-line options."""
+    if args.bot is not None:
+        return args.bot
+    if args.script is not None:
+        return script(args.script)
+    return human
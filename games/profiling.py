@@ -0,0 +1 @@
+../tools/profiling.py
\ No newline at end of file
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Columnar array of rational numbers
+# Version : 1.0.2
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Columnar array of rational numbers backed by NumPy.
+
+Numerators and denominators are kept in two int64 arrays, always in lowest
+terms and with a positive denominator, and the arithmetic and comparisons
+work on whole arrays at once. Before every operation the size of the
+intermediate products is estimated in floating point; the elements that
+could overflow int64 are computed one by one with Python integers and
+kept apart (promoted) as Fraction objects, while the rest stay in the
+arrays.
+
+NumPy is optional for the games: import this module only where bulk work
+is needed. Run it as a script to compare it with plain Fraction objects.
+"""
+
+import argparse
+import operator
+import time
+from fractions import Fraction
+import numpy as np
+
+LIMIT = float(2 ** 62)
+INT64_MIN = np.iinfo(np.int64).min
+
+class RationalArray:
+    """Array of rational numbers in lowest terms."""
+
+    __hash__ = None
+
+    def __init__(self, nums, dens=None):
+        if dens is None:
+            dens = [1] * len(nums)
+        if len(nums) != len(dens):
+            raise ValueError("Numerators and denominators differ in size.")
+        self.big = {}
+        try:
+            self.num = np.array(nums, dtype=np.int64)
+            self.den = np.array(dens, dtype=np.int64)
+        except OverflowError:
+            self.num = np.zeros(len(nums), dtype=np.int64)
+            self.den = np.ones(len(dens), dtype=np.int64)
+            for index, (num, den) in enumerate(zip(nums, dens)):
+                self[index] = Fraction(int(num), int(den))
+            return
+        if np.any(self.den == 0):
+            raise ZeroDivisionError("Denominator is zero.")
+        # -2**63 fits int64 but its negation does not: promote it.
+        edge = (self.num == INT64_MIN) | (self.den == INT64_MIN)
+        self._normalise(~edge)
+        for index in np.flatnonzero(edge):
+            index = int(index)
+            value = Fraction(int(self.num[index]), int(self.den[index]))
+            self.num[index], self.den[index] = 0, 1
+            self[index] = value
+
+    @classmethod
+    def _empty(cls, size):
+        """Array of zeros of a given size."""
+        array = cls.__new__(cls)
+        array.big = {}
+        array.num = np.zeros(size, dtype=np.int64)
+        array.den = np.ones(size, dtype=np.int64)
+        return array
+
+    def _normalise(self, mask):
+        """Reduce to lowest terms with positive denominators."""
+        num, den = self.num[mask], self.den[mask]
+        sign = np.where(den < 0, -1, 1)
+        common = np.gcd(num, den)
+        common[common == 0] = 1
+        self.num[mask] = sign * num // common
+        self.den[mask] = sign * den // common
+
+    def __len__(self):
+        return len(self.num)
+
+    def __getitem__(self, index):
+        if index in self.big:
+            return self.big[index]
+        return Fraction(int(self.num[index]), int(self.den[index]))
+
+    def __setitem__(self, index, value):
+        value = Fraction(value)
+        if abs(value.numerator) < 2 ** 63 and value.denominator < 2 ** 63:
+            self.big.pop(index, None)
+            self.num[index] = value.numerator
+            self.den[index] = value.denominator
+        else:
+            self.big[index] = value
+            self.num[index] = 0
+            self.den[index] = 1
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self):
+        return f"RationalArray({[str(value) for value in self]})"
+
+    def promoted(self):
+        """Mask of the elements kept as Python integers."""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[list(self.big)] = True
+        return mask
+
+    def _check(self, other):
+        """Make sure both arrays can be combined."""
+        if not isinstance(other, RationalArray):
+            return NotImplemented
+        if len(other) != len(self):
+            raise ValueError("Arrays differ in size.")
+        return other
+
+    def _binary(self, other, func):
+        """Apply an operation element by element."""
+        other = self._check(other)
+        if other is NotImplemented:
+            return other
+        a, b = self.num, self.den
+        c, d = other.num, other.den
+        fa, fb = np.abs(a.astype(float)), np.abs(b.astype(float))
+        fc, fd = np.abs(c.astype(float)), np.abs(d.astype(float))
+        if func in (operator.add, operator.sub):
+            bounds = (fa * fd + fc * fb, fb * fd)
+        elif func is operator.mul:
+            bounds = (fa * fc, fb * fd)
+        else:
+            if np.any((c == 0) & ~other.promoted()):
+                raise ZeroDivisionError("Division by zero.")
+            bounds = (fa * fd, fb * fc)
+        safe = (bounds[0] < LIMIT) & (bounds[1] < LIMIT)
+        safe &= ~(self.promoted() | other.promoted())
+
+        result = self._empty(len(self))
+        with np.errstate(over='ignore'):
+            if func is operator.add:
+                num, den = a * d + c * b, b * d
+            elif func is operator.sub:
+                num, den = a * d - c * b, b * d
+            elif func is operator.mul:
+                num, den = a * c, b * d
+            else:
+                num, den = a * d, b * c
+        result.num[safe] = num[safe]
+        result.den[safe] = den[safe]
+        result._normalise(safe)
+        for index in np.flatnonzero(~safe):
+            index = int(index)
+            result[index] = func(self[index], other[index])
+        return result
+
+    @classmethod
+    def where(cls, mask, first, second):
+        """Elements of first where mask is true, of second elsewhere."""
+        result = cls._empty(len(mask))
+        result.num = np.where(mask, first.num, second.num)
+        result.den = np.where(mask, first.den, second.den)
+        for index, value in first.big.items():
+            if mask[index]:
+                result.big[index] = value
+        for index, value in second.big.items():
+            if not mask[index]:
+                result.big[index] = value
+        return result
+
+    def __neg__(self):
+        result = self._empty(len(self))
+        edge = self.num == INT64_MIN
+        result.num = np.where(edge, 0, -self.num)
+        result.den = np.where(edge, 1, self.den)
+        result.big = {index: -value for index, value in self.big.items()}
+        for index in np.flatnonzero(edge):
+            result[int(index)] = -self[int(index)]
+        return result
+
+    def __add__(self, other):
+        return self._binary(other, operator.add)
+
+    def __sub__(self, other):
+        return self._binary(other, operator.sub)
+
+    def __mul__(self, other):
+        return self._binary(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self._binary(other, operator.truediv)
+
+    def compare(self, other):
+        """Sign of self - other, element by element (-1, 0 or 1)."""
+        other = self._check(other)
+        if other is NotImplemented:
+            raise TypeError("Only rational arrays can be compared.")
+        left = np.abs(self.num.astype(float)) * other.den
+        right = np.abs(other.num.astype(float)) * self.den
+        safe = (left < LIMIT) & (right < LIMIT)
+        safe &= ~(self.promoted() | other.promoted())
+        with np.errstate(over='ignore'):
+            diff = self.num * other.den - other.num * self.den
+        signs = np.sign(diff, where=safe,
+                        out=np.zeros(len(self), dtype=np.int64))
+        for index in np.flatnonzero(~safe):
+            index = int(index)
+            diff = self[index] - other[index]
+            signs[index] = (diff > 0) - (diff < 0)
+        return signs.astype(np.int8)
+
+    def __eq__(self, other):
+        return self.compare(other) == 0
+
+    def __ne__(self, other):
+        return self.compare(other) != 0
+
+    def __lt__(self, other):
+        return self.compare(other) < 0
+
+    def __le__(self, other):
+        return self.compare(other) <= 0
+
+    def __gt__(self, other):
+        return self.compare(other) > 0
+
+    def __ge__(self, other):
+        return self.compare(other) >= 0
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the rational arrays.")
+    parser.add_argument('-d',
+        type=int,
+        default=4,
+        metavar='Int',
+        help="Digits for the numerators and denominators (default = 4)")
+    parser.add_argument('-n',
+        type=int,
+        default=1000000,
+        metavar='Int',
+        help="Number of fractions (default = 1000000)")
+    args = parser.parse_args()
+    if args.d < 1 or args.d > 18 or args.n < 1:
+        parser.error("Digits must be between 1 and 18.")
+    return args
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    rng = np.random.default_rng()
+    low, high = 10 ** (args.d - 1), 10 ** args.d
+    columns = [rng.integers(low, high, args.n) for _ in range(4)]
+
+    start = time.perf_counter()
+    frac1 = RationalArray(columns[0], columns[1])
+    frac2 = RationalArray(columns[2], columns[3])
+    results = [frac1 + frac2, frac1 - frac2, frac1 * frac2, frac1 / frac2]
+    signs = frac1.compare(frac2)
+    interval_array = time.perf_counter() - start
+
+    count = min(args.n, 100000)
+    operands = [[int(value) for value in column[:count]]
+                for column in columns]
+    checks = []
+    start = time.perf_counter()
+    for num1, den1, num2, den2 in zip(*operands):
+        f1 = Fraction(num1, den1)
+        f2 = Fraction(num2, den2)
+        checks.append(([f1 + f2, f1 - f2, f1 * f2, f1 / f2],
+                       (f1 > f2) - (f1 < f2)))
+    interval_fraction = time.perf_counter() - start
+
+    for i, (values, sign) in enumerate(checks):
+        if values != [result[i] for result in results] or sign != signs[i]:
+            raise AssertionError(f"Mismatch in problem {i}")
+
+    promoted = sum(len(result.big) for result in results)
+    print()
+    print(f"> Fractions: {args.n} of {args.d} digits")
+    print(f"> Promoted: {promoted} results")
+    print(f"> RationalArray: {round(args.n / interval_array):,} problems/sec")
+    print(f"> Fraction: {round(count / interval_fraction):,} problems/sec "
+          f"(checked against the array)")
+
+if __name__ == '__main__':
+    main()
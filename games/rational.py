@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Rational numbers backend
+# Version : 1.0.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Rational numbers backend for the fraction games.
+
+The games build their fractions with rational.Rational(num, den), which is
+gmpy2.mpq when gmpy2 is installed and fractions.Fraction otherwise. Both
+keep the fraction in lowest terms and support the same arithmetic,
+comparisons, numerator, denominator and str(). The environment variable
+MATHS_RATIONAL=fractions forces the standard library backend; an unknown
+or missing backend falls back to fractions, with a warning on stderr.
+
+Run it as a script to compare the speed of the available backends.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+BACKENDS = {'fractions': Fraction}
+if gmpy2 is not None:
+    BACKENDS['gmpy2'] = gmpy2.mpq
+
+def use(name):
+    """Select the backend used by Rational."""
+    global Rational, BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Rational backend not available: {name}")
+    Rational = BACKENDS[name]
+    BACKEND = name
+
+def from_environment():
+    """Select the backend of MATHS_RATIONAL, or the fastest one."""
+    name = os.environ.get('MATHS_RATIONAL',
+                          'gmpy2' if 'gmpy2' in BACKENDS else 'fractions')
+    try:
+        use(name)
+    except ValueError as err:
+        print(f"Warning: {err}; using fractions.", file=sys.stderr)
+        use('fractions')
+
+from_environment()
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the rational numbers backends.")
+    parser.add_argument('-d',
+        type=int,
+        default=4,
+        metavar='Int',
+        help="Digits for the numerators and denominators (default = 4)")
+    parser.add_argument('-n',
+        type=int,
+        default=100000,
+        metavar='Int',
+        help="Operations per benchmark (default = 100000)")
+    args = parser.parse_args()
+    if args.d < 1 or args.n < 1:
+        parser.error("Digits and operations must be positive.")
+    return args
+
+def benchmark(name, operands, count):
+    """Rates of every benchmark for a backend (+, -, *, / count as one)."""
+    kind = BACKENDS[name]
+    timings = {}
+
+    start = time.perf_counter()
+    values = [kind(num, den) for num, den in operands]
+    timings['normalisation'] = time.perf_counter() - start
+
+    pairs = list(zip(values, values[1:] + values[:1]))
+    start = time.perf_counter()
+    for frac1, frac2 in pairs:
+        _ = frac1 + frac2
+        _ = frac1 - frac2
+        _ = frac1 * frac2
+        _ = frac1 / frac2
+    timings['arithmetic'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for frac1, frac2 in pairs:
+        _ = frac1 < frac2
+        _ = frac1 == frac2
+    timings['comparison'] = time.perf_counter() - start
+
+    return {task: count / interval for task, interval in timings.items()}
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    low, high = 10 ** (args.d - 1), 10 ** args.d - 1
+    operands = [(random.randint(low, high), random.randint(low, high))
+                for _ in range(args.n)]
+
+    print()
+    print(f"Operands: {args.d} digits, {args.n} per benchmark")
+    for name in BACKENDS:
+        rates = benchmark(name, operands, args.n)
+        print()
+        print(f"> {name}:")
+        for task, rate in rates.items():
+            print(f"  {task:<14} {round(rate):>12,} /sec")
+    if gmpy2 is None:
+        print()
+        print("gmpy2 is not installed: only fractions was measured.")
+
+if __name__ == '__main__':
+    main()
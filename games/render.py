@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Buffered output for the games
+# Version : 1.0.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Buffered output for the games.
+
+Every block of lines (a question, a feedback message, the final score) is
+joined in one string and written with one call, so a round costs a couple
+of writes instead of one per line. In screen mode the questions are drawn
+in place at the top of the terminal and only the lines that differ from
+the previous question are rewritten, using the terminfo capabilities
+given by curses.
+"""
+
+import sys
+
+_screen = {}
+
+def add_arguments(parser):
+    """Add the output options to a game parser."""
+    parser.add_argument('--screen',
+        action='store_true',
+        help="Redraw every question in place (needs a terminal)")
+
+def enable_screen():
+    """Draw the questions in place; return False if not possible."""
+    if not sys.stdout.isatty():
+        return False
+    try:
+        import curses
+    except ImportError:
+        return False
+    try:
+        curses.setupterm()
+    except curses.error:
+        return False
+    caps = {}
+    for name in ('clear', 'cup', 'el', 'ed'):
+        cap = curses.tigetstr(name)
+        if not cap:
+            return False
+        caps[name] = cap
+    _screen.update(caps=caps, tparm=curses.tparm, previous=None)
+    return True
+
+def _cap(name, *params):
+    """Terminal capability as a string."""
+    cap = _screen['caps'][name]
+    if params:
+        cap = _screen['tparm'](cap, *params)
+    return cap.decode('latin-1')
+
+def _redraw(lines):
+    """Text that turns the previous question into this one."""
+    previous = _screen['previous']
+    parts = []
+    if previous is None:
+        parts.append(_cap('clear'))
+        previous = []
+    for row, line in enumerate(lines):
+        if row >= len(previous) or previous[row] != line:
+            parts.extend([_cap('cup', row, 0), line, _cap('el')])
+    parts.extend([_cap('cup', len(lines), 0), _cap('ed')])
+    _screen['previous'] = list(lines)
+    return ''.join(parts)
+
+def show(lines):
+    """Write a block of lines with a single write."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+def frame(lines):
+    """Write a question; in screen mode, redraw it in place."""
+    if not _screen:
+        show(lines)
+        return
+    sys.stdout.write(_redraw(lines))
+    sys.stdout.flush()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Session packs
+# Version : 1.0.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 2026/10/19
+# Changed : 2026/10/19
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Session packs: the same questions for every player.
+
+A pack is written once, from a seed, with the problem generator of one of
+the games, and then played with --pack by as many players as needed. The
+games map the file and unpack the records one by one as the rounds go, so
+a session starts at once, whatever the size of the pack.
+
+File layout (little endian, fixed-width records):
+    header  : magic, version, game, digits A, digits B, operators, seed,
+              records
+    records : four operands (unused ones are 0) and the operator index
+
+    multiplications : factor 1, factor 2
+    fractions_calc  : num1, den1, num2, den2, operator
+    fractions_simp  : numerator, denominator
+    fractions_comp  : num1, den1, num2, den2
+"""
+
+import argparse
+import itertools
+import mmap
+import random
+import struct
+
+MAGIC = b'FPAK'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBB8sQQ')
+RECORD = struct.Struct('<IIIIB3x')
+GAMES = ('multiplications', 'fractions_calc', 'fractions_simp',
+         'fractions_comp')
+OPERATORS = '+-*/'
+WIDTHS = {'multiplications': 2, 'fractions_calc': 4, 'fractions_simp': 2,
+          'fractions_comp': 4}
+MAX_DIGITS = 9
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Write a session pack for the games.")
+    parser.add_argument('game',
+        choices=GAMES,
+        help="Game the pack is for")
+    parser.add_argument('-a',
+        type=pack_digit,
+        default=1,
+        metavar='Int',
+        help="Digits for the 1st operand or numerator (default = 1)")
+    parser.add_argument('-b',
+        type=pack_digit,
+        default=1,
+        metavar='Int',
+        help="Digits for the 2nd operand or denominator (default = 1)")
+    parser.add_argument("-o",
+        type=str,
+        default='+-*/',
+        help="Arithmetic operations for fractions_calc (default: all)")
+    parser.add_argument('-n',
+        type=int,
+        default=10,
+        metavar='Int',
+        help="Number of problems (default = 10)")
+    parser.add_argument('--seed',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Random seed (default: a random one, saved in the pack)")
+    parser.add_argument('file',
+        help="Output pack file")
+    args = parser.parse_args()
+    if not args.o or any(op not in OPERATORS for op in args.o):
+        parser.error("Operations must be some of '+-*/'.")
+    if args.n < 1:
+        parser.error("The number of problems must be positive.")
+    if args.game == 'multiplications' and max(args.a, args.b) > 4:
+        parser.error("Multiplications need digits between 1 and 4.")
+    return args
+
+def pack_digit(digit):
+    """Allow only the digits that fit a record."""
+    int_digit = int(digit)
+    if int_digit < 1 or int_digit > MAX_DIGITS:
+        raise argparse.ArgumentTypeError(
+            f"Digits must be between 1 and {MAX_DIGITS}.")
+    return int_digit
+
+def add_arguments(parser):
+    """Add the session pack option to a parser."""
+    parser.add_argument('--pack',
+        type=str,
+        default=None,
+        metavar='File',
+        help="Play the problems of a session pack (see sessionpack.py)")
+
+def generator(game, digits_a, digits_b, opers):
+    """Problem generator of a game (imported only when writing)."""
+    # pylint: disable=import-outside-toplevel
+    if game == 'multiplications':
+        import multiplications
+        return multiplications.random_problems(digits_a, digits_b)
+    if game == 'fractions_calc':
+        import fractions_calc
+        return fractions_calc.random_problems(digits_a, digits_b, opers)
+    if game == 'fractions_simp':
+        import fractions_simp
+        return fractions_simp.random_problems(digits_a, digits_b)
+    import fractions_comp
+    return fractions_comp.random_problems(digits_a, digits_b)
+
+def write(path, game, digits_a, digits_b, count, opers='+-*/', seed=None):
+    """Write a pack and return its seed."""
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    random.seed(seed)
+    opers = ''.join(op for op in OPERATORS if op in opers)
+    problems = generator(game, digits_a, digits_b, opers)
+    records = bytearray()
+    for problem in itertools.islice(problems, count):
+        operands = list(problem[:WIDTHS[game]]) + [0] * 4
+        ope = OPERATORS.index(problem[4]) if game == 'fractions_calc' else 0
+        records += RECORD.pack(*operands[:4], ope)
+    header = HEADER.pack(MAGIC, VERSION, GAMES.index(game), digits_a,
+                         digits_b, opers.encode('ascii'), seed, count)
+    with open(path, 'wb') as file_handle:
+        file_handle.write(header)
+        file_handle.write(records)
+    return seed
+
+class Pack:
+    """Read-only, memory-mapped view of a session pack."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as file_handle:
+            self.data = mmap.mmap(file_handle.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"Not a session pack: {path}")
+        (magic, version, game, self.digits_a, self.digits_b, opers,
+         self.seed, self.count) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION or game >= len(GAMES) or \
+                len(self.data) < HEADER.size + self.count * RECORD.size:
+            raise ValueError(f"Not a session pack: {path}")
+        self.game = GAMES[game]
+        self.opers = opers.rstrip(b'\0').decode('ascii')
+
+    def __len__(self):
+        return self.count
+
+    def problem(self, index):
+        """Problem at the given position, as the game generates it."""
+        record = RECORD.unpack_from(self.data,
+                                    HEADER.size + index * RECORD.size)
+        return self._problem(record)
+
+    def _problem(self, record):
+        """Problem tuple of an unpacked record."""
+        problem = record[:WIDTHS[self.game]]
+        if self.game == 'fractions_calc':
+            problem += (OPERATORS[record[4]],)
+        return problem
+
+    def __iter__(self):
+        view = memoryview(self.data)[HEADER.size:
+                                     HEADER.size + self.count * RECORD.size]
+        return map(self._problem, RECORD.iter_unpack(view))
+
+def problems(path, game, rounds):
+    """Open a pack for a game; return it and an iterator of problems."""
+    try:
+        pack = Pack(path)
+    except OSError as err:
+        raise ValueError(f"Cannot open the session pack: {err}") from err
+    if pack.game != game:
+        raise ValueError(f"This session pack is for {pack.game}.")
+    if rounds > len(pack):
+        raise ValueError(f"This session pack has only {len(pack)} "
+                         "problems.")
+    return pack, iter(pack)
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    seed = write(args.file, args.game, args.a, args.b, args.n, args.o,
+                 args.seed)
+    print(f"> {args.n} problems for {args.game} saved to {args.file} "
+          f"(seed {seed})")
+
+if __name__ == '__main__':
+    main()
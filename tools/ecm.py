@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Elliptic-curve factorization
+# Version : 1.0.2
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Tool to find a factor of a number with the elliptic-curve method.
+
+Every curve is a Montgomery curve By^2 = x^3 + Ax^2 + x, chosen with
+Suyama's parametrization, and only the x and z coordinates of the points
+are used. Stage 1 multiplies a point by every prime power up to B1; stage
+2 looks for one more prime between B1 and B2, with baby and giant steps.
+The curves are independent, so they can run in several processes: the
+first one that finds a factor stops the others.
+
+The factorization tool tries ECM when Pollard-rho gives up, which finds
+factors of 15 to 35 digits in numbers too big for rho alone.
+"""
+
+import argparse
+import multiprocessing
+import queue
+import random
+import time
+from math import gcd
+import primes
+
+D = 2310
+SCHEDULE = (
+    (2000, 25),
+    (11000, 90),
+    (50000, 300),
+    (250000, 700),
+    (1000000, 1800),
+    (3000000, 5100),
+)
+
+class Factor(Exception):
+    """A factor was found while computing an inverse."""
+
+    def __init__(self, factor):
+        super().__init__(factor)
+        self.factor = factor
+
+def double(point, a24, n):
+    """2P."""
+    x, z = point
+    total = (x + z) * (x + z) % n
+    diff = (x - z) * (x - z) % n
+    t = total - diff
+    return total * diff % n, t * (diff + a24 * t) % n
+
+def add(p, q, difference, n):
+    """P + Q, when P - Q is known."""
+    u = (p[0] - p[1]) * (q[0] + q[1])
+    v = (p[0] + p[1]) * (q[0] - q[1])
+    return (difference[1] * (u + v) ** 2 % n,
+            difference[0] * (u - v) ** 2 % n)
+
+def multiply(k, point, a24, n):
+    """kP with the Montgomery ladder."""
+    low, high = point, double(point, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            low, high = add(high, low, point, n), double(high, a24, n)
+        else:
+            low, high = double(low, a24, n), add(high, low, point, n)
+    return low
+
+def curve(n, rng):
+    """Random curve and point (Suyama): a24 = (A + 2) / 4 and (x, z)."""
+    sigma = rng.randrange(6, n - 1)
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    denominator = 16 * x * v % n
+    factor = gcd(denominator, n)
+    if factor != 1:
+        raise Factor(factor)
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+    return a24, (x, z)
+
+def stage1(point, a24, n, b1, stop=None):
+    """Multiply the point by every prime power up to B1."""
+    for count, prime in enumerate(primes.primes_between(2, b1 + 1)):
+        power = prime
+        while power * prime <= b1:
+            power *= prime
+        point = multiply(power, point, a24, n)
+        if stop is not None and count % 1000 == 0 and stop.is_set():
+            return None
+    return point
+
+def stage2(point, a24, n, b1, b2, stop=None):
+    """Product of x_q z_m - x_m z_q for the primes q = m ± b in (B1, B2].
+
+    Return 1 (no factor) as soon as stop is set.
+    """
+    baby = {1: point}
+    twice = double(point, a24, n)
+    previous, current = point, add(twice, point, point, n)
+    for b in range(3, D // 2, 2):
+        if gcd(b, D) == 1:
+            baby[b] = current
+        previous, current = current, add(current, twice, previous, n)
+
+    step = multiply(D, point, a24, n)
+    m = max(1, (b1 + D // 2) // D)
+    giant = multiply(m * D, point, a24, n)
+    following = multiply((m + 1) * D, point, a24, n)
+    product = 1
+    candidates = primes.primes_between(max(b1, D // 2) + 1, b2 + 1)
+    for count, prime in enumerate(candidates):
+        if stop is not None and count % 4096 == 0 and stop.is_set():
+            return 1
+        while prime > m * D + D // 2:
+            m += 1
+            giant, following = following, add(following, step, giant, n)
+        x, z = baby[abs(prime - m * D)]
+        product = product * (giant[0] * z - x * giant[1]) % n
+    return product
+
+def attempt(n, b1, b2, rng, stop=None):
+    """Run one curve; return a factor, or None."""
+    try:
+        a24, point = curve(n, rng)
+    except Factor as found:
+        return found.factor if found.factor != n else None
+    point = stage1(point, a24, n, b1, stop)
+    if point is None:
+        return None
+    factor = gcd(point[1], n)
+    if factor == 1 and b2 > b1:
+        factor = gcd(stage2(point, a24, n, b1, b2, stop), n)
+    return factor if 1 < factor < n else None
+
+def worker(n, b1, b2, curves, seed, stop, done, results):
+    """Run curves until a factor is found or the curves run out."""
+    rng = random.Random(seed)
+    try:
+        while not stop.is_set():
+            with done.get_lock():
+                if done.value >= curves:
+                    break
+                done.value += 1
+            factor = attempt(n, b1, b2, rng, stop)
+            if factor is not None:
+                results.put(factor)
+                stop.set()
+    finally:
+        results.put(None)
+
+def run(n, b1, b2=None, curves=100, jobs=1, seed=None):
+    """Run curves in parallel; return the factor (or None) and curves."""
+    b2 = 100 * b1 if b2 is None else b2
+    rng = random.Random(seed)
+    if jobs == 1:
+        for count in range(1, curves + 1):
+            factor = attempt(n, b1, b2, rng)
+            if factor is not None:
+                return factor, count
+        return None, curves
+    stop = multiprocessing.Event()
+    done = multiprocessing.Value('i', 0)
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(
+                   target=worker,
+                   args=(n, b1, b2, curves, rng.getrandbits(64), stop,
+                         done, results))
+               for _ in range(jobs)]
+    for process in workers:
+        process.start()
+    factor, finished = None, 0
+    while finished < jobs:
+        try:
+            found = results.get(timeout=1)
+        except queue.Empty:
+            if all(process.exitcode is not None for process in workers):
+                break  # a worker was killed before it could say so
+            continue
+        if found is None:
+            finished += 1
+        elif factor is None:
+            factor = found
+    for process in workers:
+        process.join()
+    failed = [process.exitcode for process in workers if process.exitcode]
+    if factor is None and failed:
+        raise RuntimeError(f"An ECM worker failed (exit code {failed[0]}).")
+    return factor, min(done.value, curves)
+
+def find_factor(n, jobs=1):
+    """A non-trivial factor of a composite n, raising B1 as needed."""
+    schedule = iter(SCHEDULE)
+    b1, curves = next(schedule)
+    while True:
+        factor, _ = run(n, b1, curves=curves, jobs=jobs, seed=n)
+        if factor is not None:
+            return factor
+        b1, curves = next(schedule, (3 * b1, 3 * curves))
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Elliptic-curve factorization for the command line.")
+    parser.add_argument('number',
+        type=int,
+        help="Composite integer to find a factor of")
+    parser.add_argument('-b', '--b1',
+        type=int,
+        default=50000,
+        metavar='Int',
+        help="Stage 1 bound (default = 50000)")
+    parser.add_argument('-B', '--b2',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Stage 2 bound (default = 100 * B1)")
+    parser.add_argument('-c', '--curves',
+        type=int,
+        default=300,
+        metavar='Int',
+        help="Most curves to run (default = 300)")
+    parser.add_argument('-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Processes running curves (default = 1)")
+    parser.add_argument('-s', '--seed',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Seed for the curves (default = random)")
+    args = parser.parse_args()
+    if args.number < 4 or primes.is_prime(args.number):
+        parser.error("The number must be composite.")
+    if args.b1 < 2 or (args.b2 is not None and args.b2 < args.b1):
+        parser.error("B1 must be at least 2, and B2 at least B1.")
+    if args.curves < 1 or args.jobs < 1:
+        parser.error("Curves and jobs must be integers greater than 0.")
+    return args
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    b2 = 100 * args.b1 if args.b2 is None else args.b2
+    start = time.perf_counter()
+    factor, curves = run(args.number, args.b1, b2, args.curves, args.jobs,
+                         args.seed)
+    interval = time.perf_counter() - start
+    print()
+    if factor is None:
+        print(f"> No factor found with B1 = {args.b1} and B2 = {b2}")
+    else:
+        print(f"> {args.number} = {factor} * {args.number // factor}")
+    print(f"> Curves: {curves} in {interval:.3f} sec "
+          f"({curves / interval:.2f} curves/sec, {args.jobs} jobs)")
+
+if __name__ == '__main__':
+    main()
@@ -2,38 +2,93 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : Factorization in prime factors
-# Version : 2.0.1
+# Version : 2.6.1
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
 # Created : 02/06/2018
-# Changed : 21/02/2026
+# Changed : 19/10/2026
 # URL     : http://github.com/gerardbm/maths
 # --------------------------------------------------
-"""Tool to factorize a number into prime factors."""
+"""Tool to factorize a number into prime factors.
+
+n!, C(n, k) and n# (primorial) are factorized straight from a sieve of
+the primes up to n, with Legendre's formula, without computing them."""
 
 import argparse
+import functools
+import ecm
+import ndjson
+import primes
+import profiling
+
+RHO_LIMIT = 1 << 20
 
-def parse_arguments():
+def parse_arguments(argv=None):
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         description="Factorization tool for the command line.")
-    parser.add_argument('number',
+    parser.add_argument('numbers',
         type=int,
+        nargs='*',
+        metavar='number',
         help="Integer value to factorize in prime factors")
-    args = parser.parse_args()
-    if args.number < 2:
+    parser.add_argument('--factorial',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Factorize n! without computing it")
+    parser.add_argument('--binomial',
+        type=int,
+        nargs=2,
+        default=None,
+        metavar='Int',
+        help="Factorize C(n, k) without computing it")
+    parser.add_argument('--primorial',
+        type=int,
+        default=None,
+        metavar='Int',
+        help="Factorize n# (product of the primes up to n)")
+    parser.add_argument('--format',
+        choices=('text', 'ndjson'),
+        default='text',
+        help="Output format: the ladder (text) or one JSON object per "
+             "number (ndjson)")
+    parser.add_argument('-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Processes running ECM curves (default = 1)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    specials = (args.factorial, args.binomial, args.primorial)
+    if not args.numbers and specials == (None, None, None):
+        parser.error("Give a number, --factorial, --binomial or "
+                     "--primorial.")
+    if args.numbers and min(args.numbers) < 2:
         parser.error("The number must be an integer greater than 1.")
-    return args.number
+    if min(value for value in (args.factorial, args.primorial, 0)
+           if value is not None) < 0:
+        parser.error("n must be an integer greater than or equal to 0.")
+    if args.binomial and not 0 <= args.binomial[1] <= args.binomial[0]:
+        parser.error("C(n, k) needs 0 <= k <= n.")
+    if args.jobs < 1:
+        parser.error("Jobs must be an integer greater than 0.")
+    return args
+
+def methods(jobs=1):
+    """Pollard-rho for a while, then ECM."""
+    return (functools.partial(primes.pollard_rho, limit=RHO_LIMIT),
+            functools.partial(ecm.find_factor, jobs=jobs))
 
-def decomposition(number):
+def decomposition(number, jobs=1):
     """Decompose the number into prime factors!"""
     dividend = number
-    divisor = 2
     columns = []
     factors = []
-    while dividend >= divisor:
-        while dividend % divisor == 0:
+    for divisor, exponent in primes.factorize(number,
+                                              methods=methods(jobs)):
+        for _ in range(exponent):
             aligned = abs(len(str(dividend)) - len(str(number)))
             columns.extend([
                 " ",
@@ -43,10 +98,68 @@ def decomposition(number):
                 divisor,
                 "\n",
             ])
-            dividend = int(dividend / divisor)
+            dividend //= divisor
             factors.extend([divisor])
-        divisor = divisor + 1
-    return columns, factors, divisor
+    return columns, factors, factors[-1]
+
+def prime_factors(number, jobs=1):
+    """Prime factors and exponents, without building the ladder."""
+    return primes.factorize(number, methods=methods(jobs))
+
+def legendre(n, prime):
+    """Exponent of the prime in n! (Legendre's formula)."""
+    exponent = 0
+    while n:
+        n //= prime
+        exponent += n
+    return exponent
+
+def factorial_factors(n):
+    """Prime factors and exponents of n!"""
+    return [(prime, legendre(n, prime))
+            for prime in primes.primes_between(2, n + 1)]
+
+def binomial_factors(n, k):
+    """Prime factors and exponents of C(n, k).
+
+    The exponent of p is the number of carries when adding k and n - k
+    in base p (Kummer's theorem)."""
+    grouped = []
+    for prime in primes.primes_between(2, n + 1):
+        exponent = (legendre(n, prime) - legendre(k, prime)
+                    - legendre(n - k, prime))
+        if exponent:
+            grouped.append((prime, exponent))
+    return grouped
+
+def primorial_factors(n):
+    """Prime factors and exponents of n#."""
+    return [(prime, 1) for prime in primes.primes_between(2, n + 1)]
+
+def specials(args):
+    """Name, fields and factors of the factorial, binomial, primorial."""
+    if args.factorial is not None:
+        n = args.factorial
+        with profiling.phase('factorial'):
+            grouped = factorial_factors(n)
+        yield f"{n}!", {'factorial': n}, grouped
+    if args.binomial is not None:
+        n, k = args.binomial
+        with profiling.phase('binomial'):
+            grouped = binomial_factors(n, k)
+        yield f"C({n}, {k})", {'binomial': [n, k]}, grouped
+    if args.primorial is not None:
+        n = args.primorial
+        with profiling.phase('primorial'):
+            grouped = primorial_factors(n)
+        yield f"{n}#", {'primorial': n}, grouped
+
+def records(numbers, jobs=1):
+    """NDJSON records with the factorization of every number."""
+    for number in numbers:
+        with profiling.phase('prime_factors'):
+            factors = prime_factors(number, jobs)
+        yield {'number': number, 'factors': factors}
 
 def format_group(factors):
     """Formatted output: group factors and exponents."""
@@ -80,13 +193,37 @@ def output(joined, columns, number, factors, divisor):
     print('Exponential form:')
     print('>', number, '=', joined)
 
-def main():
+def main(argv=None):
     """Main program."""
-    number = parse_arguments()
-    columns, factors, divisor = decomposition(number)
-    grouped = format_group(factors)
-    joined = format_join(grouped)
-    output(joined, columns, number, factors, divisor)
+    started = profiling.clock()
+    args = parse_arguments(argv)
+    profiling.start(args.profile, args.profile_out, 'factorization',
+                    started)
+    profiling.record('parse', started)
+    try:
+        if args.format == 'ndjson':
+            ndjson.write(records(args.numbers, args.jobs))
+            ndjson.write(dict(fields, factors=grouped)
+                         for _, fields, grouped in specials(args))
+            return
+        for number in args.numbers:
+            with profiling.phase('decomposition'):
+                columns, factors, divisor = decomposition(number, args.jobs)
+            with profiling.phase('format_group'):
+                grouped = format_group(factors)
+            with profiling.phase('format_join'):
+                joined = format_join(grouped)
+            with profiling.phase('output'):
+                output(joined, columns, number, factors, divisor)
+        for name, _, grouped in specials(args):
+            with profiling.phase('format_join'):
+                joined = format_join(grouped) or '1'
+            with profiling.phase('output'):
+                print()
+                print('Exponential form:')
+                print('>', name, '=', joined)
+    finally:
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
@@ -2,12 +2,12 @@
 # -*- coding: utf-8 -*-
 # --------------------------------------------------
 # Name    : LCM & GCD
-# Version : 2.1.0
+# Version : 2.4.1
 # Python  : 3.13.5
 # License : MIT
 # Author  : Gerard Bajona
 # Created : 17/07/2022
-# Changed : 22/02/2026
+# Changed : 19/10/2026
 # URL     : http://github.com/gerardbm/maths
 # --------------------------------------------------
 """LCM & GCD calculator"""
@@ -15,42 +15,75 @@
 import argparse
 from math import gcd
 from functools import reduce
+import ndjson
+import profiling
 
-def parse_arguments():
+def parse_arguments(argv=None):
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         description="LCM & GCD calculator.")
     parser.add_argument(
         "numbers",
         type=str,
+        nargs='+',
         help="Integers separated by comma (e.g., 12,18,24)")
-    args = parser.parse_args()
-    try:
-        values = list(map(int, args.numbers.split(",")))
-    except ValueError:
-        parser.error("Provide a list of integers separated by comma.")
-    if len(values) < 2:
-        parser.error("Provide at least two integers.")
-    return values
+    parser.add_argument(
+        "--format",
+        choices=('text', 'ndjson'),
+        default='text',
+        help="Output format: text or one JSON object per list (ndjson)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    lists = []
+    for numbers in args.numbers:
+        try:
+            values = list(map(int, numbers.split(",")))
+        except ValueError:
+            parser.error("Provide a list of integers separated by comma.")
+        if len(values) < 2:
+            parser.error("Provide at least two integers.")
+        lists.append(values)
+    return lists, args
 
 def lcm(a, b):
     """LCM of two integers."""
     return abs(a * b) // gcd(a, b)
 
+def records(lists):
+    """NDJSON records with the LCM & GCD of every list."""
+    for values in lists:
+        with profiling.phase('lcm_gcd'):
+            record = {'numbers': values,
+                      'lcm': reduce(lcm, values),
+                      'gcd': reduce(gcd, values)}
+        yield record
+
 def get_lcm_gcd(values):
     """LCM & GCD"""
-    result_gcd = reduce(gcd, values)
-    result_lcm = reduce(lcm, values)
+    with profiling.phase('lcm_gcd'):
+        result_gcd = reduce(gcd, values)
+        result_lcm = reduce(lcm, values)
     values_fmt = str(values).strip('[,]')
 
-    print()
-    print(f"> LCM({values_fmt}) =", result_lcm)
-    print(f"> GCD({values_fmt}) =", result_gcd)
+    with profiling.phase('output'):
+        print()
+        print(f"> LCM({values_fmt}) =", result_lcm)
+        print(f"> GCD({values_fmt}) =", result_gcd)
 
-def main():
+def main(argv=None):
     """Main program."""
-    values = parse_arguments()
-    get_lcm_gcd(values)
+    started = profiling.clock()
+    lists, args = parse_arguments(argv)
+    profiling.start(args.profile, args.profile_out, 'lcm_gcd', started)
+    profiling.record('parse', started)
+    try:
+        if args.format == 'ndjson':
+            ndjson.write(records(lists))
+            return
+        for values in lists:
+            get_lcm_gcd(values)
+    finally:
+        profiling.stop()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Maths daemon client
+# Version : 1.2.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Thin client for the maths daemon (mathd.py).
+
+    mathc.py factorization 360
+    mathc.py lcm_gcd 12,18,24
+    mathc.py primes nextprime 1000
+
+takes the same arguments and prints the same output as the tools, but the
+work is done by the daemon. With '-' as the only argument it reads one
+command per line from stdin and sends them all without waiting for the
+answers (pipelining), which is the fast way to call the tools in a loop.
+If the daemon is not running, a single command is run locally. A primes
+command without numbers reads them from stdin, as the tool does, and sends
+them along (echo 7 | mathc.py primes isprime).
+
+It avoids argparse and other heavy imports on purpose.
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+
+SOCKET = os.environ.get('MATHD_SOCKET',
+                        os.path.join(os.path.expanduser('~'), '.mathd.sock'))
+
+def connect():
+    """Socket connected to the daemon, or None."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(SOCKET)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+def send(client, requests):
+    """Send the requests, one JSON line each, and close the sending side."""
+    for request in requests:
+        client.sendall(json.dumps(request).encode('utf8') + b'\n')
+    client.shutdown(socket.SHUT_WR)
+
+def receive(client):
+    """Print every response; return the last non-zero exit code."""
+    status = 0
+    with client.makefile('rb') as responses:
+        for line in responses:
+            response = json.loads(line)
+            sys.stdout.write(response['out'])
+            sys.stderr.write(response['err'])
+            if response['code']:
+                status = response['code']
+    sys.stdout.flush()
+    return status
+
+def reads_stdin(argv):
+    """Check whether the tool reads its numbers from stdin."""
+    return argv[0] == 'primes' and not any(
+        arg.lstrip('-').isdigit() for arg in argv[1:])
+
+def local(request):
+    """Run a command without the daemon."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import mathd  # pylint: disable=import-outside-toplevel
+    code, out, err = mathd.run(request['argv'], request['stdin'])
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    return code
+
+def main():
+    """Main program."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        return 0
+    if argv == ['-']:
+        requests = [{'argv': line.split(), 'stdin': ''}
+                    for line in sys.stdin if line.strip()]
+    else:
+        stdin = sys.stdin.read() if reads_stdin(argv) else ''
+        requests = [{'argv': argv, 'stdin': stdin}]
+
+    client = connect()
+    if client is None:
+        if len(requests) == 1:
+            return local(requests[0])
+        sys.stderr.write(f"mathd is not running on {SOCKET}\n")
+        return 1
+    with client:
+        sender = threading.Thread(target=send, args=(client, requests))
+        sender.start()
+        status = receive(client)
+        sender.join()
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Maths daemon
+# Version : 1.3.0
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Long-running server for the maths tools.
+
+The daemon listens on a Unix socket and runs the tools in its own process,
+so every request skips the Python startup and keeps the caches warm. Each
+request is one line with a JSON list: the tool name and its arguments, as
+they would be typed in the command line; or a JSON object with that list
+as "argv" and the text the tool reads from stdin as "stdin". Each response
+is one line with a JSON object: the exit code and the text written to
+stdout and stderr.
+Requests on the same connection are answered in order, so a client can
+send many of them without waiting (pipelining).
+
+Every connection has its own thread, and requests on different
+connections run at the same time: stdin, stdout, stderr and the program
+name are set per thread, so a long count does not hold up a quick test
+(they still share the CPU). The base primes of the segmented sieve are
+kept between requests. The profiler measures the whole process, so a
+request with --profile waits until the running requests end and runs
+alone; the requests that come meanwhile wait for it.
+
+Use mathc.py as the client.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from bisect import bisect_right
+from pathlib import Path
+import factorization
+import lcm_gcd
+import primecount
+import primes
+
+SOCKET = Path(os.environ.get('MATHD_SOCKET', Path.home() / '.mathd.sock'))
+
+TOOLS = {
+    'factorization': factorization.main,
+    'lcm_gcd': lcm_gcd.main,
+    'primecount': primecount.main,
+    'primes': primes.main,
+}
+
+SIEVE_LIMIT = 10 ** 7
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Daemon for the maths tools.")
+    parser.add_argument('-S', '--socket',
+        type=Path,
+        default=SOCKET,
+        metavar='Path',
+        help=f"Unix socket to listen on (default = {SOCKET})")
+    parser.add_argument('--cache',
+        type=int,
+        default=65536,
+        metavar='Int',
+        help="Results kept in every cache (default = 65536)")
+    return parser.parse_args()
+
+def warm_caches(size):
+    """Keep the results of the expensive functions in memory."""
+    factorization.decomposition = functools.lru_cache(maxsize=size)(
+        factorization.decomposition)
+    primes.is_prime = functools.lru_cache(maxsize=size)(primes.is_prime)
+    primes.sieve = warm_sieve(primes.sieve)
+
+def warm_sieve(sieve):
+    """Keep the largest sieve so far and answer smaller ones from it."""
+    kept = {'limit': 1, 'primes': []}
+    lock = threading.Lock()
+
+    def cached(limit):
+        if limit > SIEVE_LIMIT:
+            return sieve(limit)
+        with lock:
+            if limit > kept['limit']:
+                kept['limit'] = min(max(limit, 2 * kept['limit']),
+                                    SIEVE_LIMIT)
+                kept['primes'] = sieve(kept['limit'])
+            found = kept['primes']
+        return found[:bisect_right(found, limit)]
+    return cached
+
+class PerThread:
+    """Stream that every thread can point somewhere else."""
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(getattr(self.local, 'stream', self.default), name)
+
+    def __iter__(self):
+        return iter(getattr(self.local, 'stream', self.default))
+
+    @contextlib.contextmanager
+    def redirect(self, stream):
+        """Send the calls of this thread to another stream."""
+        self.local.stream = stream
+        try:
+            yield
+        finally:
+            del self.local.stream
+
+class Argv(list):
+    """sys.argv whose program name (argv[0]) is set per thread."""
+
+    def __init__(self, argv):
+        super().__init__(argv)
+        self.local = threading.local()
+
+    def __getitem__(self, index):
+        if index == 0 and hasattr(self.local, 'program'):
+            return self.local.program
+        return super().__getitem__(index)
+
+class Gate:
+    """Many plain requests at once, or one profiled request alone."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.running = 0
+        self.waiting = 0
+        self.alone = False
+
+    @contextlib.contextmanager
+    def enter(self, alone):
+        """Hold the gate while a request runs."""
+        with self.condition:
+            if alone:
+                self.waiting += 1
+                self.condition.wait_for(
+                    lambda: not self.alone and not self.running)
+                self.waiting -= 1
+                self.alone = True
+            else:
+                self.condition.wait_for(
+                    lambda: not self.alone and not self.waiting)
+            self.running += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.running -= 1
+                if alone:
+                    self.alone = False
+                self.condition.notify_all()
+
+GATE = Gate()
+
+def per_thread():
+    """Let every request have its own stdio and program name."""
+    if isinstance(sys.argv, Argv):
+        return
+    sys.stdin = PerThread(sys.stdin)
+    sys.stdout = PerThread(sys.stdout)
+    sys.stderr = PerThread(sys.stderr)
+    sys.argv = Argv(sys.argv)
+
+def run(argv, stdin=''):
+    """Run a tool; return the exit code, stdout and stderr."""
+    if not argv or argv[0] not in TOOLS:
+        return 2, '', f"Unknown tool. Available: {', '.join(TOOLS)}\n"
+    tool, args = argv[0], argv[1:]
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    per_thread()
+    sys.argv.local.program = f"{tool}.py"
+    profiled = any(arg.startswith('--prof') for arg in args)
+    try:
+        with GATE.enter(profiled), sys.stdin.redirect(io.StringIO(stdin)), \
+                sys.stdout.redirect(out), sys.stderr.redirect(err):
+            TOOLS[tool](args)
+    except SystemExit as exit_error:
+        if isinstance(exit_error.code, int):
+            code = exit_error.code
+        elif exit_error.code is not None:
+            err.write(f"{exit_error.code}\n")
+            code = 1
+    except Exception as error:  # pylint: disable=broad-except
+        err.write(f"{type(error).__name__}: {error}\n")
+        code = 1
+    finally:
+        del sys.argv.local.program
+    return code, out.getvalue(), err.getvalue()
+
+def parse_request(line):
+    """Arguments and stdin of a request line."""
+    request = json.loads(line)
+    if isinstance(request, dict):
+        argv, stdin = request.get('argv'), request.get('stdin', '')
+    else:
+        argv, stdin = request, ''
+    if not isinstance(argv, list) or not isinstance(stdin, str):
+        raise ValueError("Malformed request.")
+    return [str(arg) for arg in argv], stdin
+
+class Handler(socketserver.StreamRequestHandler):
+    """Answer the requests of one connection, in order."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                argv, stdin = parse_request(line)
+            except ValueError:
+                code, out, err = 2, '', "Malformed request.\n"
+            else:
+                code, out, err = run(argv, stdin)
+            response = json.dumps({'code': code, 'out': out, 'err': err},
+                                  separators=(',', ':'))
+            self.wfile.write(response.encode('utf8') + b'\n')
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server."""
+
+    daemon_threads = True
+
+def running(path):
+    """Check whether a daemon is already listening on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+def main():
+    """Main program."""
+    args = parse_arguments()
+    if running(args.socket):
+        sys.exit(f"mathd is already running on {args.socket}")
+    warm_caches(args.cache)
+    per_thread()
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(args.socket)
+    with Server(str(args.socket), Handler) as server:
+        os.chmod(args.socket, 0o600)
+        print(f"> Listening on {args.socket}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(args.socket)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : NDJSON output
+# Version : 1.0.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Machine-readable output: one compact JSON object per line."""
+
+import json
+import sys
+
+CHUNK = 1 << 16
+
+def write(records, stream=None):
+    """Write the records as they come, in chunks of about 64 KiB."""
+    if stream is None:
+        stream = sys.stdout
+    lines = []
+    size = 0
+    try:
+        for record in records:
+            line = json.dumps(record, separators=(',', ':'))
+            lines.append(line)
+            size += len(line) + 1
+            if size >= CHUNK:
+                stream.write('\n'.join(lines) + '\n')
+                lines = []
+                size = 0
+    finally:
+        # Also on an error or Ctrl-C: keep the records already made.
+        if lines:
+            stream.write('\n'.join(lines) + '\n')
+        stream.flush()
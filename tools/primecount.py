@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Prime counting
+# Version : 1.0.2
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Tool to count the primes up to x and to find the n-th prime.
+
+π(x) is computed with Lehmer's formula (the Meissel-Lehmer method): only
+the primes up to a limit around x^(2/3) are sieved, and the rest comes
+from φ(x, a), the count of numbers up to x without any of the first a
+prime factors. The n-th prime is found from an estimate: π(estimate) with
+Lehmer's formula, then a segmented sieve up or down to the n-th prime.
+
+The sums of Lehmer's formula, and the plain segmented sieve that --compare
+runs next to it to show both times, can be split among --jobs processes.
+"""
+
+import argparse
+import time
+from array import array
+from bisect import bisect_right
+from math import isqrt, log, prod
+from multiprocessing import Pool
+import ndjson
+import primes
+import profiling
+
+SMALL = 6
+MEMORY = 10 ** 8
+
+def iroot(number, degree):
+    """Integer part of the root of a number."""
+    root = int(round(number ** (1 / degree)))
+    while root ** degree > number:
+        root -= 1
+    while (root + 1) ** degree <= number:
+        root += 1
+    return root
+
+class PrimeCounter:
+    """π(x) with Lehmer's formula."""
+
+    def __init__(self, x, memory=MEMORY):
+        limit = max(isqrt(x), min(iroot(x * x, 3), memory), 1000)
+        self.limit = limit
+        self.primes = array('Q', primes.primes_between(2, limit + 1))
+        self.cache = {}
+        self.tables = []
+        for count in range(SMALL + 1):
+            small = self.primes[:count]
+            period = prod(small)
+            counts = array('I', [0]) * (period + 1)
+            total = 0
+            for number in range(period):
+                if all(number % prime for prime in small):
+                    total += 1
+                counts[number + 1] = total
+            self.tables.append((period, counts))
+
+    def phi(self, x, a):
+        """Numbers up to x that no one of the first a primes divides."""
+        if a <= SMALL:
+            period, counts = self.tables[a]
+            return x // period * counts[period] + counts[x % period + 1]
+        if x < self.primes[a]:
+            return 1
+        if x <= self.limit and self.primes[a - 1] ** 2 >= x:
+            return self.pi(x) - a + 1
+        key = (x, a)
+        if key in self.cache:
+            return self.cache[key]
+        result = self.phi(x, SMALL)
+        for index in range(SMALL, a):
+            result -= self.phi(x // self.primes[index], index)
+        self.cache[key] = result
+        return result
+
+    def pi(self, x, jobs=1):
+        """Number of primes up to x."""
+        if x <= self.limit:
+            return bisect_right(self.primes, x)
+        a = self.pi(iroot(x, 4))
+        b = self.pi(isqrt(x))
+        total = self.phi(x, a) + (b + a - 2) * (b - a + 1) // 2
+        if jobs == 1:
+            return total - self.partial(x, range(a, b))
+        with Pool(jobs, initializer=_start, initargs=(self,)) as pool:
+            parts = [(x, range(a + job, b, jobs)) for job in range(jobs)]
+            return total - sum(pool.starmap(_partial, parts))
+
+    def partial(self, x, indexes):
+        """Sums of Lehmer's formula for some of the primes up to √x."""
+        c = self.pi(iroot(x, 3))
+        total = 0
+        for i in indexes:
+            quotient = x // self.primes[i]
+            total += self.pi(quotient)
+            if i < c:
+                for j in range(i, self.pi(isqrt(quotient))):
+                    total += self.pi(quotient // self.primes[j]) - j
+        return total
+
+_counter = []
+
+def _start(counter):
+    """Keep the counter of the parent in a worker process."""
+    _counter[:] = [counter]
+
+def _partial(x, indexes):
+    """PrimeCounter.partial in a worker process."""
+    return _counter[0].partial(x, indexes)
+
+def sieve_count(x, jobs=1):
+    """π(x) with a plain segmented sieve, split among processes."""
+    if jobs == 1:
+        return primes.count_between(0, x + 1)
+    step = (x + jobs) // jobs
+    ranges = [(low, min(low + step, x + 1)) for low in range(0, x + 1, step)]
+    with Pool(jobs) as pool:
+        return sum(pool.starmap(primes.count_between, ranges))
+
+def estimate(n):
+    """Approximation of the n-th prime (Cipolla)."""
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    ln = log(n)
+    lnln = log(ln)
+    return int(n * (ln + lnln - 1 + (lnln - 2) / ln))
+
+def nth_prime(n, memory=MEMORY):
+    """The n-th prime: π(estimate), then sieve to the exact one."""
+    if n <= len(primes.SMALL_PRIMES):
+        return primes.SMALL_PRIMES[n - 1]
+    guess = estimate(n)
+    count = PrimeCounter(guess, memory).pi(guess)
+    size = 2 * primes.SEGMENT
+    if count < n:
+        for low in range(guess + 1, guess + 1 + n * size, size):
+            found = primes.count_between(low, low + size)
+            if count + found >= n:
+                segment = primes.primes_between(low, low + size)
+                return list(segment)[n - count - 1]
+            count += found
+    for high in range(guess + 1, 0, -size):
+        low = max(high - size, 0)
+        found = primes.count_between(low, high)
+        if count - found < n:
+            segment = list(primes.primes_between(low, high))
+            return segment[n - (count - found) - 1]
+        count -= found
+    raise ValueError("The position must be greater than 0.")
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Prime counting tool for the command line.")
+    parser.add_argument('command',
+        choices=('pi', 'nth'),
+        help="Count the primes up to x (pi) or find the n-th prime (nth)")
+    parser.add_argument('numbers',
+        type=int,
+        nargs='+',
+        metavar='number',
+        help="Upper bounds (pi) or positions (nth)")
+    parser.add_argument('-m', '--memory',
+        type=int,
+        default=MEMORY,
+        metavar='Int',
+        help=f"Largest sieve for Lehmer's formula (default = {MEMORY})")
+    parser.add_argument('-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='Int',
+        help="Processes for the counts (default = 1)")
+    parser.add_argument('--compare',
+        action='store_true',
+        help="Also count with a plain sieve and show both times")
+    parser.add_argument('--format',
+        choices=('text', 'ndjson'),
+        default='text',
+        help="Output format: text or one JSON object per number (ndjson)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if min(args.numbers) < 1:
+        parser.error("The numbers must be integers greater than 0.")
+    if args.jobs < 1 or args.memory < 1:
+        parser.error("Jobs and memory must be integers greater than 0.")
+    if args.compare and args.command != 'pi':
+        parser.error("--compare only works with pi.")
+    return args
+
+def records(args):
+    """Result, and timings, for every number."""
+    for number in args.numbers:
+        start = time.perf_counter()
+        with profiling.phase(args.command):
+            if args.command == 'pi':
+                counter = PrimeCounter(number, args.memory)
+                result = counter.pi(number, args.jobs)
+            else:
+                result = nth_prime(number, args.memory)
+        record = {'number': number, args.command: result,
+                  'seconds': round(time.perf_counter() - start, 6)}
+        if args.compare:
+            start = time.perf_counter()
+            with profiling.phase('sieve'):
+                record['sieve'] = sieve_count(number, args.jobs)
+            record['sieve_seconds'] = round(time.perf_counter() - start, 6)
+        yield record
+
+def main(argv=None):
+    """Main program."""
+    started = profiling.clock()
+    args = parse_arguments(argv)
+    profiling.start(args.profile, args.profile_out, 'primecount', started)
+    profiling.record('parse', started)
+    try:
+        if args.format == 'ndjson':
+            ndjson.write(records(args))
+            return
+        for record in records(args):
+            number, seconds = record['number'], record['seconds']
+            if args.command == 'pi':
+                print(f"> pi({number}) = {record['pi']} ({seconds:.3f} sec)")
+            else:
+                print(f"> prime({number}) = {record['nth']} "
+                      f"({seconds:.3f} sec)")
+            if args.compare:
+                print(f"> sieve({number}) = {record['sieve']} "
+                      f"({record['sieve_seconds']:.3f} sec, {args.jobs} jobs)")
+    finally:
+        profiling.stop()
+
+if __name__ == '__main__':
+    main()
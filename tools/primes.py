@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Primality tests
+# Version : 1.2.2
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Primality tests, prime search and factorization helpers.
+
+    is_prime        : Miller-Rabin with fixed bases, deterministic below
+                      3.3 * 10^24 (all 64-bit numbers included), and
+                      Baillie-PSW (no known counterexample) above
+    next_prime      : smallest prime greater than n
+    prev_prime      : largest prime smaller than n
+    trial_division  : 2·3·5·7 wheel, up to the square root or a limit
+    pollard_rho     : Brent's variant, for the cofactors left
+    factorize       : trial division first, then Pollard-rho (or other
+                      methods, such as ECM from ecm.py)
+    segments        : segmented sieve of Eratosthenes, in bounded memory
+
+All of them use exact integer arithmetic only.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+from collections import Counter
+from math import gcd, isqrt
+import ndjson
+import profiling
+
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MR_LIMIT = 3317044064679887385961981
+WHEEL = (2, 3, 5, 7)
+WHEEL_GAPS = tuple(b - a for a, b in itertools.pairwise(
+    [r for r in range(11, 11 + 211) if gcd(r, 210) == 1]))
+TRIAL_LIMIT = 100000
+SEGMENT = 1 << 18
+
+def sieve(limit):
+    """Primes up to the limit (sieve of Eratosthenes)."""
+    if limit < 2:
+        return []
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for i in range(2, isqrt(limit) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, flag in enumerate(flags) if flag]
+
+SMALL_PRIMES = sieve(1000)
+
+def segments(low, high, size=SEGMENT):
+    """Sieve the odd numbers of [low, high) one segment at a time.
+
+    Yield (start, flags) for every segment: flags[i] is 1 when the odd
+    number start + 2 * i is prime. Only the primes up to the square root
+    of high are kept, so memory does not grow with the range."""
+    low = max(low, 1) | 1
+    base = sieve(isqrt(max(high - 1, 0)))[1:]
+    for start in range(low, high, 2 * size):
+        stop = min(start + 2 * size, high)
+        flags = bytearray([1]) * ((stop - start + 1) // 2)
+        for prime in base:
+            square = prime * prime
+            if square >= stop:
+                break
+            first = max(square, (start + prime - 1) // prime * prime)
+            if first % 2 == 0:
+                first += prime
+            index = (first - start) // 2
+            flags[index::prime] = bytes(len(range(index, len(flags), prime)))
+        if start == 1:
+            flags[0] = 0
+        yield start, flags
+
+def primes_between(low, high):
+    """Primes in [low, high), in order, from a segmented sieve."""
+    if low <= 2 < high:
+        yield 2
+    for start, flags in segments(low, high):
+        yield from itertools.compress(range(start, start + 2 * len(flags), 2),
+                                      flags)
+
+def count_between(low, high):
+    """Number of primes in [low, high), from a segmented sieve."""
+    count = 1 if low <= 2 < high else 0
+    for _, flags in segments(low, high):
+        count += flags.count(1)
+    return count
+
+def wheel():
+    """2, 3, 5, 7 and then the numbers coprime to 210."""
+    yield from WHEEL
+    candidate = 11
+    for gap in itertools.cycle(WHEEL_GAPS):
+        yield candidate
+        candidate += gap
+
+def _strong_probable_prime(n, base):
+    """Miller-Rabin test of an odd n for one base."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(base, d, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def _jacobi(a, n):
+    """Jacobi symbol (a/n) for an odd positive n."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def _strong_lucas_probable_prime(n):
+    """Strong Lucas test of an odd n, with Selfridge's parameters."""
+    if isqrt(n) ** 2 == n:
+        return False
+    d = 5
+    while True:
+        jacobi = _jacobi(d, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+
+    k, s = n + 1, 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
+    u, v, qk = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == '1':
+            u, v = p * u + v, d * u + p * v
+            if u % 2:
+                u += n
+            if v % 2:
+                v += n
+            u, v = u // 2 % n, v // 2 % n
+            qk = qk * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        if v == 0:
+            return True
+        qk = qk * qk % n
+    return False
+
+def is_prime(n):
+    """Check whether n is a prime number."""
+    if n < 2:
+        return False
+    for prime in SMALL_PRIMES:
+        if n % prime == 0:
+            return n == prime
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    if n < MR_LIMIT:
+        return all(_strong_probable_prime(n, base) for base in MR_BASES)
+    return (_strong_probable_prime(n, 2)
+            and _strong_lucas_probable_prime(n))
+
+def next_prime(n):
+    """Smallest prime greater than n."""
+    if n < 2:
+        return 2
+    candidate = n + 1 + n % 2
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
+
+def prev_prime(n):
+    """Largest prime smaller than n (n must be greater than 2)."""
+    if n <= 2:
+        raise ValueError("There is no prime smaller than 2.")
+    if n == 3:
+        return 2
+    candidate = n - 1 - n % 2
+    while not is_prime(candidate):
+        candidate -= 2
+    return candidate
+
+def trial_division(n, limit=None):
+    """Divide out the primes up to the square root or the limit.
+
+    Return the factors found, as (prime, exponent) pairs, and the
+    cofactor left. The cofactor has no prime factor up to the limit; if
+    the square root was reached first, it is 1 or a prime."""
+    factors = []
+    for divisor in wheel():
+        if divisor * divisor > n or (limit is not None and divisor > limit):
+            break
+        if n % divisor == 0:
+            exponent = 0
+            while n % divisor == 0:
+                n //= divisor
+                exponent += 1
+            factors.append((divisor, exponent))
+    return factors, n
+
+def pollard_rho(n, limit=None):
+    """A non-trivial factor of an odd composite n (Brent's method).
+
+    With a limit, give up and return None after that many steps."""
+    rng = random.Random(n)
+    steps = 0
+    while True:
+        y, c, step = rng.randrange(1, n), rng.randrange(1, n), 128
+        factor = power = product = 1
+        while factor == 1:
+            if limit is not None and steps > limit:
+                return None
+            x = y
+            for _ in range(power):
+                y = (y * y + c) % n
+            done = 0
+            while done < power and factor == 1:
+                saved = y
+                for _ in range(min(step, power - done)):
+                    y = (y * y + c) % n
+                    product = product * abs(x - y) % n
+                factor = gcd(product, n)
+                done += step
+            steps += 2 * power
+            power *= 2
+        if factor == n:
+            factor = 1
+            while factor == 1:
+                saved = (saved * saved + c) % n
+                factor = gcd(abs(x - saved), n)
+        if factor != n:
+            return factor
+
+def split(n, methods=(pollard_rho,)):
+    """Prime factors of a number with no small factors, with repeats.
+
+    The methods are tried in order until one of them returns a factor;
+    the last one must always find it."""
+    found = Counter()
+    pending = [n]
+    while pending:
+        number = pending.pop()
+        if is_prime(number):
+            found[number] += 1
+            continue
+        root = isqrt(number)
+        if root * root == number:
+            pending += [root, root]
+            continue
+        for method in methods:
+            factor = method(number)
+            if factor is not None:
+                break
+        pending += [factor, number // factor]
+    return found
+
+def factorize(n, limit=TRIAL_LIMIT, methods=(pollard_rho,)):
+    """Prime factors of n, as sorted (prime, exponent) pairs."""
+    factors, rest = trial_division(n, limit)
+    if rest > 1:
+        factors += sorted(split(rest, methods).items())
+    return factors
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Primality tests for the command line.")
+    parser.add_argument('command',
+        choices=('isprime', 'nextprime', 'prevprime'),
+        help="Test the numbers, or find the next or the previous prime")
+    parser.add_argument('numbers',
+        type=int,
+        nargs='*',
+        metavar='number',
+        help="Integers to check (default: read them from stdin)")
+    parser.add_argument('--format',
+        choices=('text', 'ndjson'),
+        default='text',
+        help="Output format: text or one JSON object per number (ndjson)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.command == 'prevprime' and args.numbers \
+            and min(args.numbers) <= 2:
+        parser.error("There is no prime smaller than 2.")
+    return args
+
+def read_numbers(command):
+    """Integers from stdin, separated by blanks or lines."""
+    for line in sys.stdin:
+        for word in line.split():
+            try:
+                number = int(word)
+            except ValueError:
+                sys.exit(f"Not an integer: {word}")
+            if command == 'prevprime' and number <= 2:
+                sys.exit(f"There is no prime smaller than 2 (read {word}).")
+            yield number
+
+def results(command, numbers):
+    """Result of the command for every number."""
+    for number in numbers:
+        with profiling.phase(command):
+            if command == 'isprime':
+                result = is_prime(number)
+            elif command == 'nextprime':
+                result = next_prime(number)
+            else:
+                result = prev_prime(number)
+        yield number, result
+
+def main(argv=None):
+    """Main program."""
+    started = profiling.clock()
+    args = parse_arguments(argv)
+    profiling.start(args.profile, args.profile_out, 'primes', started)
+    profiling.record('parse', started)
+    try:
+        numbers = args.numbers or read_numbers(args.command)
+        answers = results(args.command, numbers)
+        if args.format == 'ndjson':
+            key = 'prime' if args.command == 'isprime' else args.command
+            ndjson.write({'number': number, key: result}
+                         for number, result in answers)
+        else:
+            for number, result in answers:
+                if args.command == 'isprime':
+                    verdict = "is prime" if result else "is not prime"
+                    print(f"> {number} {verdict}")
+                else:
+                    print(f"> {args.command}({number}) = {result}")
+    finally:
+        profiling.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# --------------------------------------------------
+# Name    : Profiling hooks
+# Version : 1.0.1
+# Python  : 3.13.5
+# License : MIT
+# Author  : Gerard Bajona
+# Created : 19/10/2026
+# Changed : 19/10/2026
+# URL     : http://github.com/gerardbm/maths
+# --------------------------------------------------
+"""Profiling and tracing hooks for the entry points.
+
+The programs mark their phases with profiling.phase(name). Unless the
+profiler was started with --profile, phase() returns the same empty
+context manager every time, so the hooks cost almost nothing. When it is
+started it can collect:
+
+    timings     : wall and CPU time, and calls, of every phase
+    tracemalloc : peak memory and the lines that allocated most
+    cprofile    : time spent in every function
+
+The report is written as JSON to stderr or to --profile-out; with a
+.pstats file the cProfile stats are dumped in the pstats format instead
+and the rest of the report goes to the same name with .json.
+
+games/profiling.py is a symbolic link to this file, so the games and the
+tools import the same module by its bare name.
+"""
+
+import argparse
+import contextlib
+import cProfile
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+KINDS = ('timings', 'tracemalloc', 'cprofile')
+TOP = 25
+
+_NULL = contextlib.nullcontext()
+_state = {}
+
+def kinds_type(value):
+    """Comma-separated kinds of profile, or 'all'."""
+    kinds = KINDS if value == 'all' else tuple(value.split(','))
+    for kind in kinds:
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(
+                f"Profile must be 'all' or some of: {', '.join(KINDS)}")
+    return kinds
+
+def add_arguments(parser):
+    """Add the profiling options to a parser."""
+    parser.add_argument('--profile',
+        type=kinds_type,
+        default=None,
+        metavar='Kinds',
+        help="Profile the run: 'all' or some of timings, tracemalloc, "
+             "cprofile (comma separated)")
+    parser.add_argument('--profile-out',
+        type=Path,
+        default=None,
+        metavar='File',
+        help="Write the profile to a .json or .pstats file "
+             "(default: JSON to stderr)")
+
+def clock():
+    """Current wall and CPU times."""
+    return time.perf_counter(), time.process_time()
+
+def start(kinds, path=None, name=None, started=None):
+    """Start profiling; do nothing if no kinds are given."""
+    if not kinds:
+        return
+    _state.update(kinds=kinds, path=path,
+                  name=name or Path(sys.argv[0]).stem,
+                  started=started or clock(), phases={})
+    if 'tracemalloc' in kinds:
+        tracemalloc.start()
+    if 'cprofile' in kinds:
+        _state['profiler'] = cProfile.Profile()
+        _state['profiler'].enable()
+
+def record(name, started):
+    """Add the time since started to a phase."""
+    if not _state:
+        return
+    wall, cpu = clock()
+    totals = _state['phases'].setdefault(name, [0, 0.0, 0.0])
+    totals[0] += 1
+    totals[1] += wall - started[0]
+    totals[2] += cpu - started[1]
+
+@contextlib.contextmanager
+def _phase(name):
+    """Time a phase."""
+    started = clock()
+    try:
+        yield
+    finally:
+        record(name, started)
+
+def phase(name):
+    """Context manager that times a phase while profiling."""
+    if not _state:
+        return _NULL
+    return _phase(name)
+
+def _cprofile_top(profiler):
+    """Functions with the most cumulative time."""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in \
+            stats.stats.items():
+        rows.append({'function': f"{filename}:{line}({function})",
+                     'calls': calls,
+                     'tottime': round(tottime, 6),
+                     'cumtime': round(cumtime, 6)})
+    rows.sort(key=lambda row: row['cumtime'], reverse=True)
+    return rows[:TOP]
+
+def stop():
+    """Stop profiling and write the report."""
+    if not _state:
+        return
+    kinds, path = _state['kinds'], _state['path']
+    wall, cpu = clock()
+    report = {'program': _state['name'],
+              'wall': round(wall - _state['started'][0], 6),
+              'cpu': round(cpu - _state['started'][1], 6)}
+
+    profiler = _state.get('profiler')
+    if profiler is not None:
+        profiler.disable()
+
+    if 'tracemalloc' in kinds:
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__)])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report['tracemalloc'] = {
+            'peak': peak,
+            'top': [{'where': str(stat.traceback), 'size': stat.size,
+                     'count': stat.count}
+                    for stat in snapshot.statistics('lineno')[:TOP]]}
+
+    if profiler is not None:
+        if path is not None and path.suffix == '.pstats':
+            profiler.dump_stats(path)
+            path = path.with_suffix('.json')
+        else:
+            report['cprofile'] = _cprofile_top(profiler)
+
+    if 'timings' in kinds:
+        report['phases'] = {
+            name: {'calls': calls, 'wall': round(phase_wall, 6),
+                   'cpu': round(phase_cpu, 6)}
+            for name, (calls, phase_wall, phase_cpu)
+            in _state['phases'].items()}
+    _state.clear()
+
+    text = json.dumps(report, indent=2) + '\n'
+    if path is None:
+        sys.stderr.write(text)
+    else:
+        path.write_text(text, encoding='utf8')